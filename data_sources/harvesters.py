@@ -4,6 +4,7 @@
 import json
 import time
 import threading
+from concurrent.futures import ThreadPoolExecutor
 import requests
 import feedparser
 import os
@@ -71,18 +72,48 @@ class DataMorsel:
 class RSSFeedHarvester:
     """Harvests data from RSS feeds"""
     
+    # Feeds fetched at once; each fetch is a blocking HTTP round trip
+    max_parallel_fetches = 8
+    
     def __init__(self, feed_urls: List[str]):
         self.feed_urls = feed_urls
         self.seen_entries = set()
+        # url -> (etag, modified) validators from the last successful fetch
         self.last_check = {}
+    
+    def _fetch(self, url: str):
+        """Fetch and parse one feed; errors are returned for harvest() to report.
+
+        Sends the feed's last validators, so an unchanged feed answers 304
+        without a body to download and parse.
+        """
+        etag, modified = self.last_check.get(url, (None, None))
+        try:
+            return feedparser.parse(url, etag=etag, modified=modified)
+        except Exception as e:
+            return e
         
     def harvest(self) -> List[DataMorsel]:
         """Fetch new entries from RSS feeds"""
         morsels = []
         
-        for url in self.feed_urls:
+        # Fetch all feeds concurrently, then read them in configured order
+        urls = list(self.feed_urls)
+        if len(urls) > 1:
+            with ThreadPoolExecutor(max_workers=min(self.max_parallel_fetches, len(urls)),
+                                    thread_name_prefix='rss-fetch') as pool:
+                feeds = list(pool.map(self._fetch, urls))
+        else:
+            feeds = [self._fetch(url) for url in urls]
+        
+        for url, feed in zip(urls, feeds):
             try:
-                feed = feedparser.parse(url)
+                if isinstance(feed, Exception):
+                    raise feed
+                if feed.get('status') == 304:
+                    continue  # Unchanged since the last fetch: nothing new
+                if feed.get('etag') or feed.get('modified'):
+                    self.last_check[url] = (feed.get('etag'), feed.get('modified'))
                 
                 for entry in feed.entries:
                     entry_id = getattr(entry, 'id', entry.link)
@@ -119,6 +150,9 @@ class FileSystemHarvester(FileSystemEventHandler):
         self.watch_paths = watch_paths
         self.observer = Observer()
         self.harvested_morsels = []
+        # Set when new file food is waiting, so the harvest loop can drain it
+        # without waiting out its polling interval
+        self.wakeup = threading.Event()
         self.chunk_size = max(512, int(chunk_size))
         self.max_chunks = max(1, int(max_chunks))
         self.file_extensions = {
@@ -193,6 +227,7 @@ class FileSystemHarvester(FileSystemEventHandler):
                     )
                     chunks.append(morsel)
                 self.harvested_morsels.extend(chunks)
+                self.wakeup.set()
                 print(f"📁 Harvested {len(chunks)} chunk(s) of {data_type.value} from {path.name} ({event_type})")
                 
         except Exception as e:
@@ -200,8 +235,9 @@ class FileSystemHarvester(FileSystemEventHandler):
     
     def get_harvested_morsels(self) -> List[DataMorsel]:
         """Get and clear harvested morsels"""
-        morsels = self.harvested_morsels.copy()
-        self.harvested_morsels.clear()
+        # Swap rather than copy-then-clear, so chunks the watcher thread adds
+        # in between are kept for the next drain instead of being dropped
+        morsels, self.harvested_morsels = self.harvested_morsels, []
         return morsels
 
 class APIHarvester:
@@ -373,7 +409,12 @@ class DataEcosystem:
         # Food storage
         self.available_food = []
         self.consumed_food = []
+        # Serializes claiming morsels against each other and the harvest thread
+        self._food_lock = threading.Lock()
         self._seen_hashes = set()  # simple content-based dedup guard
+        # Bumped by every harvest pass and every claim; keys the stats cache
+        self._food_epoch = 0
+        self._stats_cache = None  # (key, stats) from get_ecosystem_stats
         self.food_scarcity = 1.0  # 1.0 = abundant, 0.0 = scarce
 
         # Virtual regions: lightweight habitat biases for migration experiments
@@ -441,52 +482,88 @@ class DataEcosystem:
         }
     
     def _harvest_loop(self):
-        """Background harvesting loop"""
+        """Background harvesting loop.
+
+        Network sources, freshness decay and the synthetic feeder run once per
+        harvest_interval. File food is event-driven: the watcher wakes the loop
+        and new chunks are stored right away.
+        """
+        wakeup = self.file_harvester.wakeup
+        next_full_pass = time.monotonic()
         while self.harvesting:
+            full_pass = time.monotonic() >= next_full_pass
             try:
                 # Harvest from all sources
                 new_morsels = []
                 
-                # RSS feeds
-                new_morsels.extend(self.rss_harvester.harvest())
+                if full_pass:
+                    # RSS feeds
+                    new_morsels.extend(self.rss_harvester.harvest())
                 
-                # File system
+                # File system; cleared before draining so a chunk that lands
+                # after the drain wakes the next wait
+                wakeup.clear()
                 new_morsels.extend(self.file_harvester.get_harvested_morsels())
                 
-                # APIs (less frequent)
-                if time.time() % 600 < 10:  # Every 10 minutes
-                    new_morsels.extend(self.api_harvester.harvest())
-                # Web pages (medium cadence)
-                if self.web_harvester.urls and time.time() % 300 < 10:  # ~Every 5 minutes
-                    new_morsels.extend(self.web_harvester.harvest())
+                if full_pass:
+                    # APIs (less frequent)
+                    if time.time() % 600 < 10:  # Every 10 minutes
+                        new_morsels.extend(self.api_harvester.harvest())
+                    # Web pages (medium cadence)
+                    if self.web_harvester.urls and time.time() % 300 < 10:  # ~Every 5 minutes
+                        new_morsels.extend(self.web_harvester.harvest())
                 
-                # Add to food storage with content-based dedup
-                if new_morsels:
-                    for m in new_morsels:
-                        h = hashlib.md5(m.content.encode('utf-8')).hexdigest()
-                        if h in self._seen_hashes:
-                            continue
-                        self._seen_hashes.add(h)
-                        self.available_food.append(m)
-                
-                # Manage food storage size
-                if len(self.available_food) > self.config['max_food_storage']:
-                    # Remove oldest food
-                    self.available_food = self.available_food[-self.config['max_food_storage']:]
+                self._store_harvest(new_morsels, full_pass)
                 
-                # Update scarcity
-                food_count = len(self.available_food)
-                if food_count < self.config['scarcity_threshold']:
-                    self.food_scarcity = food_count / self.config['scarcity_threshold']
-                else:
-                    self.food_scarcity = 1.0
+                if new_morsels:
+                    print(f"🍽️  Harvested {len(new_morsels)} new morsels. "
+                          f"Total food: {len(self.available_food)}, "
+                          f"Scarcity: {self.food_scarcity:.2f}")
                 
+            except Exception as e:
+                print(f"Harvest loop error: {e}")
+            
+            if full_pass:
+                next_full_pass = time.monotonic() + self.config['harvest_interval']
+            # Sleep until the next full pass, or until the watcher has new file
+            # food (stop() also sets the event, to end the loop promptly)
+            wakeup.wait(max(0.0, next_full_pass - time.monotonic()))
+    
+    def _store_harvest(self, new_morsels: List[DataMorsel], full_pass: bool):
+        """Store harvested food and update scarcity; a full pass also decays
+        freshness, purges stale food and runs the synthetic feeder.
+
+        Runs under the claim lock, since organisms claim food on the sim thread.
+        """
+        with self._food_lock:
+            # Add to food storage with content-based dedup
+            if new_morsels:
+                for m in new_morsels:
+                    h = hashlib.md5(m.content.encode('utf-8')).hexdigest()
+                    if h in self._seen_hashes:
+                        continue
+                    self._seen_hashes.add(h)
+                    self.available_food.append(m)
+        
+            # Manage food storage size
+            if len(self.available_food) > self.config['max_food_storage']:
+                # Remove oldest food
+                self.available_food = self.available_food[-self.config['max_food_storage']:]
+        
+            # Update scarcity
+            food_count = len(self.available_food)
+            if food_count < self.config['scarcity_threshold']:
+                self.food_scarcity = food_count / self.config['scarcity_threshold']
+            else:
+                self.food_scarcity = 1.0
+        
+            if full_pass:
                 # Decay food freshness
                 current_time = time.time()
                 for morsel in self.available_food:
                     time_passed = current_time - morsel.timestamp
                     morsel.decay_freshness(time_passed)
-                
+            
                 # Remove completely stale food
                 self.available_food = [m for m in self.available_food if m.freshness > 0.1]
 
@@ -497,17 +574,10 @@ class DataEcosystem:
                     if synth:
                         self.available_food.extend(synth)
                         print(f"🧠 Teacher feeder added {len(synth)} synthetic morsels. Total food: {len(self.available_food)}")
-                
-                if new_morsels:
-                    print(f"🍽️  Harvested {len(new_morsels)} new morsels. "
-                          f"Total food: {len(self.available_food)}, "
-                          f"Scarcity: {self.food_scarcity:.2f}")
-                
-            except Exception as e:
-                print(f"Harvest loop error: {e}")
             
-            time.sleep(self.config['harvest_interval'])
-    
+            # Additions, trimming, decay and purging all change the stats
+            self._food_epoch += 1
+
     def find_food_for_organism(self, organism_capabilities: set, preferences: Dict = None) -> Optional[DataMorsel]:
         """Find suitable food for an organism based on its capabilities"""
         
@@ -558,39 +628,63 @@ class DataEcosystem:
 
         suitable_food.sort(key=score, reverse=True)
         
-        # Return best food item deterministically if available
-        if suitable_food:
-            chosen_morsel = suitable_food[0]
-            self.available_food.remove(chosen_morsel)
-            self.consumed_food.append(chosen_morsel)
-            return chosen_morsel
+        # Claim the best food item still on offer; the harvest thread's purge
+        # may have taken it since the candidates were filtered
+        with self._food_lock:
+            for chosen_morsel in suitable_food:
+                try:
+                    self.available_food.remove(chosen_morsel)
+                except ValueError:
+                    continue
+                self.consumed_food.append(chosen_morsel)
+                self._food_epoch += 1
+                return chosen_morsel
         
         return None
     
+    def food_available_count(self) -> int:
+        """Number of morsels on offer, without building full ecosystem stats"""
+        return len(self.available_food)
+
     def get_ecosystem_stats(self) -> Dict[str, Any]:
-        """Get statistics about the data ecosystem"""
+        """Get statistics about the data ecosystem.
+
+        The food scan is reused until the next harvest pass or claim; each
+        caller gets its own copy.
+        """
+        food = self.available_food
+        # Taken before the scan, so a concurrent harvest invalidates the result
+        key = (self._food_epoch, len(food), len(self.consumed_food))
+        cached = self._stats_cache
+        if cached is not None and cached[0] == key:
+            return self._copy_stats(cached[1])
+        
+        # Food distribution, energy and freshness gathered in a single pass
+        food_by_type = {}
+        total_energy = 0
+        total_freshness = 0.0
+        for morsel in food:
+            data_type = morsel.data_type.value
+            food_by_type[data_type] = food_by_type.get(data_type, 0) + 1
+            total_energy += morsel.energy_value
+            total_freshness += morsel.freshness
+        
         stats = {
-            'total_food_available': len(self.available_food),
+            'total_food_available': len(food),
             'total_food_consumed': len(self.consumed_food),
             'food_scarcity': self.food_scarcity,
-            'food_by_type': {},
-            'average_freshness': 0.0,
-            'total_energy_available': 0
+            'food_by_type': food_by_type,
+            'average_freshness': total_freshness / len(food) if food else 0.0,
+            'total_energy_available': total_energy
         }
-        
-        # Calculate food distribution
-        for morsel in self.available_food:
-            data_type = morsel.data_type.value
-            if data_type not in stats['food_by_type']:
-                stats['food_by_type'][data_type] = 0
-            stats['food_by_type'][data_type] += 1
-            stats['total_energy_available'] += morsel.energy_value
-        
-        # Calculate average freshness
-        if self.available_food:
-            stats['average_freshness'] = sum(m.freshness for m in self.available_food) / len(self.available_food)
-        
-        return stats
+        self._stats_cache = (key, stats)
+        return self._copy_stats(stats)
+
+    @staticmethod
+    def _copy_stats(stats: Dict[str, Any]) -> Dict[str, Any]:
+        copy = dict(stats)
+        copy['food_by_type'] = dict(stats['food_by_type'])
+        return copy
 
     def preview_food_for_organism(self, organism_capabilities: set, preferences: Dict = None, limit: int = 5) -> List[DataMorsel]:
         """Preview suitable food without removing it.
@@ -636,6 +730,7 @@ class DataEcosystem:
     def stop(self):
         """Stop the data ecosystem"""
         self.harvesting = False
+        self.file_harvester.wakeup.set()
         self.file_harvester.stop_watching()
         if self.harvest_thread.is_alive():
             self.harvest_thread.join(timeout=5)
@@ -62,6 +62,9 @@ DEFAULT_ACTUATORS = [
     'trade',
     'migrate',                    # intent to migrate to other habitat/host (logged only for now)
 ]
+# Hashed views for membership checks (gene lists keep their order for wiring)
+DEFAULT_SENSORS_SET = frozenset(DEFAULT_SENSORS)
+DEFAULT_ACTUATORS_SET = frozenset(DEFAULT_ACTUATORS)
 
 
 class BrainGenome:
@@ -160,7 +163,7 @@ class BrainGenome:
 
     # --------- Task 8: two-parent recombination for brain genome ---------
     @staticmethod
-    def recombine(mom: 'BrainGenome', dad: 'BrainGenome', rng: Optional[random.Random] = None) -> 'BrainGenome':
+    def recombine(mom: 'BrainGenome', dad: 'BrainGenome', rng: 'Optional[random.Random]' = None) -> 'BrainGenome':
         """Recombine two parent genomes into a child genome.
 
         Policy:
@@ -236,8 +239,8 @@ class BrainGenome:
             row: List[float] = []
             for j in range(new_hid):
                 val: float
-                if i < len(mw1) and j < (len(mw1[i]) if mw1 and i < len(mw1) else 0) and 
-                   i < len(dw1) and j < (len(dw1[i]) if dw1 and i < len(dw1) else 0):
+                if (i < len(mw1) and j < (len(mw1[i]) if mw1 and i < len(mw1) else 0) and
+                        i < len(dw1) and j < (len(dw1[i]) if dw1 and i < len(dw1) else 0)):
                     val = 0.5 * (mw1[i][j] + dw1[i][j])
                 elif i < len(mw1) and j < (len(mw1[i]) if mw1 and i < len(mw1) else 0):
                     val = mw1[i][j]
@@ -397,14 +400,37 @@ class Brain:
 
     def __init__(self, genome: BrainGenome):
         self.genome = genome
-        self.topology = genome.data.get('topology', {'in': 6, 'hid': 6, 'out': 3})
-        self.w1 = genome.data.get('w1', [])
-        self.b1 = genome.data.get('b1', [])
-        self.w2 = genome.data.get('w2', [])
-        self.b2 = genome.data.get('b2', [])
-        self.activation = genome.data.get('activation', 'relu')
-        self.sensors = genome.data.get('sensors', list(DEFAULT_SENSORS))
-        self.actuators = genome.data.get('actuators', list(DEFAULT_ACTUATORS))
+        self._bind()
+
+    def _bind(self):
+        """(Re)point the phenotype at the genome's current parameter lists."""
+        data = self.genome.data
+        self.topology = data.get('topology', {'in': 6, 'hid': 6, 'out': 3})
+        self.w1 = data.get('w1', [])
+        self.b1 = data.get('b1', [])
+        self.w2 = data.get('w2', [])
+        self.b2 = data.get('b2', [])
+        self.activation = data.get('activation', 'relu')
+        self.sensors = data.get('sensors', list(DEFAULT_SENSORS))
+        self.actuators = data.get('actuators', list(DEFAULT_ACTUATORS))
+
+    def reshape(self, new_in: int, new_out: int):
+        """Resize input/output layers in place, keeping existing weights.
+
+        Only the added rows/columns are initialised; the brain object is
+        reused instead of being rebuilt from the genome.
+        """
+        # A genome without a topology gets one sized from its weights, so the
+        # resize starts from the real dimensions and the new sizes are kept
+        topo = self.genome.data.setdefault(
+            'topology', {'in': len(self.w1), 'hid': len(self.b1), 'out': len(self.b2)})
+        if new_in != topo.get('in', len(self.sensors)):
+            self.genome._resize_inputs(new_in)
+            topo['in'] = new_in
+        if new_out != topo.get('out', len(self.actuators)):
+            self.genome._resize_outputs(new_out)
+            topo['out'] = new_out
+        self._bind()
 
     def forward(self, inputs):
         """Process sensory inputs and produce motor commands or internal activations."""
@@ -284,7 +284,7 @@ class CommunityActivitySystem:
                 
                 if hasattr(teacher, 'knowledge_base') and teacher.knowledge_base:
                     for student in students:
-                        if not hasattr(student, 'knowledge_base'):
+                        if getattr(student, 'knowledge_base', None) is None:
                             from genesis.data_processor import OrganismKnowledgeBase
                             student.knowledge_base = OrganismKnowledgeBase()
                         
@@ -5,12 +5,15 @@ import re
 import json
 import hashlib
 import time
-from typing import Dict, List, Optional, Any, Set
+from typing import Dict, List, Optional, Any, Set, Tuple
 from dataclasses import dataclass
 from enum import Enum
 import feedparser
 from collections import Counter
 
+# Words that mark an insight as code-derived (one scan, no lowercased copy)
+_CODE_HINT_RE = re.compile(r'function|import', re.IGNORECASE)
+
 class DataInsight(Enum):
     """Types of insights organisms can extract from real data"""
     TRENDING_TOPIC = "trending_topic"
@@ -35,6 +38,8 @@ class ProcessedKnowledge:
     
     def __post_init__(self):
         self.id = hashlib.md5(f"{self.content}{self.source}".encode()).hexdigest()[:8]
+        # Flagged once here; organisms re-check recent insights every tick
+        self.is_code = _CODE_HINT_RE.search(self.content) is not None
 
 class OrganismDataProcessor:
     """Processes real internet data to extract meaningful insights"""
@@ -305,10 +310,17 @@ class OrganismKnowledgeBase:
         self.topic_expertise: Dict[str, float] = {}
         self.learning_history: List[Dict] = []
         self.insights_generated: int = 0
+        # Memoized knowledge-derived fields of get_knowledge_summary();
+        # cleared by add_knowledge. Learning activity depends on the clock and
+        # is never cached.
+        self._summary_cache: Optional[Dict] = None
+        # Tail of knowledge_items read by per-tick behaviors; refreshed by add_knowledge
+        self.recent_items: Tuple[ProcessedKnowledge, ...] = ()
         
     def add_knowledge(self, knowledge_list: List[ProcessedKnowledge], organism_id: str):
         """Add new knowledge to organism's knowledge base"""
         
+        self._summary_cache = None
         for knowledge in knowledge_list:
             self.knowledge_items.append(knowledge)
             self.insights_generated += 1
@@ -334,6 +346,7 @@ class OrganismKnowledgeBase:
             # Keep the most useful knowledge
             self.knowledge_items.sort(key=lambda k: k.usefulness, reverse=True)
             self.knowledge_items = self.knowledge_items[:50]
+        self.recent_items = tuple(self.knowledge_items[-5:])
     
     def get_expertise_level(self, topic: str) -> float:
         """Get organism's expertise in a topic"""
@@ -374,23 +387,49 @@ class OrganismKnowledgeBase:
         return None
     
     def get_knowledge_summary(self) -> Dict:
-        """Get summary of organism's knowledge"""
+        """Get summary of organism's knowledge.
+
+        Insight counts and expertise are cached until the next add_knowledge;
+        learning activity is evaluated against the clock on every call.
+        """
         
         if not self.knowledge_items:
             return {"total_insights": 0, "expertise_areas": [], "learning_activity": "none"}
         
-        # Top expertise areas
-        top_expertise = sorted(self.topic_expertise.items(), key=lambda x: x[1], reverse=True)[:3]
-        
-        # Recent learning activity
-        recent_learning = len([h for h in self.learning_history if time.time() - h['timestamp'] < 3600])
+        cached = self._summary_cache
+        if cached is None:
+            # Top expertise areas
+            top_expertise = sorted(self.topic_expertise.items(), key=lambda x: x[1], reverse=True)[:3]
+            cached = self._summary_cache = {
+                "total_insights": len(self.knowledge_items),
+                "expertise_areas": tuple(area for area, level in top_expertise if level > 0.5),
+                "problem_solving_capable": len(top_expertise) > 0 and top_expertise[0][1] > 1.0
+            }
         
         return {
-            "total_insights": len(self.knowledge_items),
-            "expertise_areas": [area for area, level in top_expertise if level > 0.5],
-            "learning_activity": "active" if recent_learning > 2 else "moderate" if recent_learning > 0 else "dormant",
-            "problem_solving_capable": len(top_expertise) > 0 and top_expertise[0][1] > 1.0
+            "total_insights": cached["total_insights"],
+            "expertise_areas": list(cached["expertise_areas"]),
+            "learning_activity": self._learning_activity(),
+            "problem_solving_capable": cached["problem_solving_capable"]
         }
+    
+    def insight_count(self) -> int:
+        """Number of insights currently held (the summary's total_insights)"""
+        return len(self.knowledge_items)
+    
+    def _learning_activity(self) -> str:
+        """Active, moderate or dormant by insights learned in the last hour"""
+        # History is appended in time order: walk back from the newest entry
+        # and stop at the first one outside the window (or once it is "active")
+        cutoff = time.time() - 3600
+        recent_learning = 0
+        for entry in reversed(self.learning_history):
+            if entry['timestamp'] <= cutoff:
+                break
+            recent_learning += 1
+            if recent_learning > 2:
+                return "active"
+        return "moderate" if recent_learning > 0 else "dormant"
 
 # Integration functions
 def create_data_processor():
@@ -401,7 +440,7 @@ def process_organism_food_consumption(organism, food_morsel, data_processor):
     """Process real data when organism consumes food"""
     
     # Create knowledge base if organism doesn't have one
-    if not hasattr(organism, 'knowledge_base'):
+    if getattr(organism, 'knowledge_base', None) is None:
         organism.knowledge_base = OrganismKnowledgeBase()
     
     # Extract real knowledge from the data
@@ -4,9 +4,14 @@ import json
 import os
 import random
 import time
+from collections import OrderedDict, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from typing import Dict, List, Optional, Any
-import hashlib
+import bisect
+import heapq
+from itertools import islice
+from operator import attrgetter, itemgetter
 # Robust import for script vs package execution
 try:
     from .body_parts import BodyPartGenome, Body  # type: ignore
@@ -14,9 +19,37 @@ except Exception:
     import sys as _sys, os as _os
     _sys.path.append(_os.path.dirname(_os.path.dirname(_os.path.abspath(__file__))))
     from genesis.body_parts import BodyPartGenome, Body  # type: ignore
+# Event feed and food taxonomy, resolved once at import instead of per tick
+try:
+    from genesis.stream import doom_feed
+except Exception:
+    doom_feed = None
+try:
+    from data_sources.harvesters import DataType
+except Exception:
+    DataType = None
+# DataType members keyed by their string value (nutrition profiles store values)
+_DATA_TYPE_BY_VALUE = {m.value: m for m in DataType} if DataType else {}
+try:
+    from genesis.data_processor import create_data_processor, OrganismKnowledgeBase
+except Exception:
+    create_data_processor = None
+    OrganismKnowledgeBase = None
+try:
+    from genesis.brain import (Brain, BrainGenome, DEFAULT_SENSORS, DEFAULT_ACTUATORS,
+                               DEFAULT_SENSORS_SET, DEFAULT_ACTUATORS_SET)
+except Exception:
+    Brain = BrainGenome = None
+    DEFAULT_SENSORS = DEFAULT_ACTUATORS = ()
+    DEFAULT_SENSORS_SET = DEFAULT_ACTUATORS_SET = frozenset()
 
 class Capability(Enum):
     """All evolvable capabilities - start locked, unlock through evolution"""
+
+    # Members are singletons compared by identity, so the C-level identity hash
+    # is valid and spares every `cap in self.capabilities` a Python-level
+    # Enum.__hash__ call.
+    __hash__ = object.__hash__
     
     # Basic Survival (Start with these)
     SENSE_DATA = "sense_data"          # See food nearby
@@ -54,8 +87,19 @@ class Capability(Enum):
 
 class EvolvableTraits:
     """Numerical traits that can mutate"""
+
+    # Fixed trait layout: no per-instance dict, and mutate() walks this
+    # list instead of scanning dir() every call
+    __slots__ = (
+        'size', 'speed', 'efficiency', 'resilience',
+        'curiosity', 'aggression', 'cooperation', 'risk_taking', 'patience',
+        'pattern_depth', 'memory_span', 'learning_rate', 'creativity',
+    )
+    # Alphabetical, matching the order dir() used to yield
+    _MUTABLE = tuple(sorted(__slots__))
     
     def __init__(self):
+        uniform = random.uniform
         # Physical traits
         self.size = 1.0                    # Memory capacity
         self.speed = 1.0                    # Processing speed
@@ -63,30 +107,35 @@ class EvolvableTraits:
         self.resilience = 0.3               # Damage resistance
         
         # Behavioral traits  
-        self.curiosity = random.uniform(0.1, 0.9)
-        self.aggression = random.uniform(0.0, 0.5)
-        self.cooperation = random.uniform(0.2, 0.8)
-        self.risk_taking = random.uniform(0.1, 0.7)
-        self.patience = random.uniform(0.3, 0.9)
+        self.curiosity = uniform(0.1, 0.9)
+        self.aggression = uniform(0.0, 0.5)
+        self.cooperation = uniform(0.2, 0.8)
+        self.risk_taking = uniform(0.1, 0.7)
+        self.patience = uniform(0.3, 0.9)
         
         # Cognitive traits
         self.pattern_depth = 1              # How deep patterns it sees
         self.memory_span = 10               # How much it remembers
         self.learning_rate = 0.1            # How fast it learns
-        self.creativity = random.uniform(0.0, 0.3)
+        self.creativity = uniform(0.0, 0.3)
         
     def mutate(self, mutation_rate=0.1):
         """Small random changes"""
-        for attr in dir(self):
-            if not attr.startswith('_') and isinstance(getattr(self, attr), (int, float)):
-                if random.random() < mutation_rate:
-                    current = getattr(self, attr)
-                    change = random.uniform(0.9, 1.1)
-                    setattr(self, attr, current * change)
+        rand, uniform = random.random, random.uniform
+        for attr in self._MUTABLE:
+            current = getattr(self, attr)
+            if isinstance(current, (int, float)) and rand() < mutation_rate:
+                setattr(self, attr, current * uniform(0.9, 1.1))
 
 class HelpRequest:
     """Individual help request with priority attributes"""
     
+    # Queued in bulk between batch passes; no per-request dict
+    __slots__ = (
+        'organism', 'organism_id', 'type', 'context', 'timestamp',
+        'urgency', 'novelty', 'generation', 'priority', 'cache_key',
+    )
+    
     def __init__(self, organism, request_type: str, context: Dict):
         self.organism = organism
         self.organism_id = organism.id
@@ -98,6 +147,13 @@ class HelpRequest:
         self.urgency = self.calculate_urgency()
         self.novelty = self.calculate_novelty()
         self.generation = organism.generation
+        # Sort key for prioritize_help: urgency (desc), novelty (desc),
+        # generation (asc - younger first)
+        self.priority = (-self.urgency, -self.novelty, self.generation)
+        
+        # Key of the parent's shared response cache: similar requests from
+        # similar organisms reuse one answer
+        self.cache_key = (request_type, organism.generation, len(organism.capabilities))
     
     def calculate_urgency(self) -> float:
         """How urgently does this organism need help? (0-1)"""
@@ -121,32 +177,46 @@ class HelpRequest:
         else:
             return 0.5
 
+_request_priority = attrgetter('priority')
+
 class ParentEconomy:
     """Parents have limited energy too"""
     
+    REFUSAL_REASONS = {
+        'budget_exhausted': "Parent is tired today, try tomorrow",
+        'too_advanced': "You need to grow more first",
+        'repeated_question': "You already know this answer"
+    }
+    
     def __init__(self):
         self.daily_help_budget = 10  # Only 10 LLM calls per day
         self.used_budget_today = 0
-        self.last_reset = time.time()
-        self.cached_responses = {}   # Reuse similar answers
+        # Monotonic: wall-clock adjustments must not reset or stall the budget
+        self.last_reset = time.monotonic()
+        # Reuse similar answers; least recently used entries are evicted
+        # once the cache is full, since generations grow without bound
+        self.cached_responses = OrderedDict()
+        self.cache_capacity = 1024
+        # Per-request console lines. The doom feed records every help event
+        # either way, so long runs can switch these off (performance.verbose_help)
+        self.verbose = True
         
     def reset_daily_budget_if_needed(self):
         """Reset budget at start of new day"""
-        current_time = time.time()
+        current_time = time.monotonic()
         if current_time - self.last_reset > 86400:  # 24 hours
             self.used_budget_today = 0
             self.last_reset = current_time
     
     def can_use_cached_response(self, request: HelpRequest) -> bool:
         """Check if we have a cached response for similar request"""
-        cache_key = f"{request.type}_{request.organism.generation}_{len(request.organism.capabilities)}"
-        return cache_key in self.cached_responses
+        return request.cache_key in self.cached_responses
     
     def get_cached_response(self, request: HelpRequest) -> Dict:
         """Get cached response for similar request"""
-        cache_key = f"{request.type}_{request.organism.generation}_{len(request.organism.capabilities)}"
-        cached = self.cached_responses.get(cache_key)
+        cached = self.cached_responses.get(request.cache_key)
         if cached:
+            self.cached_responses.move_to_end(request.cache_key)
             # Personalize cached response slightly
             return {
                 **cached,
@@ -157,18 +227,19 @@ class ParentEconomy:
     
     def cache_response(self, request: HelpRequest, response: Dict):
         """Cache response for future similar requests"""
-        cache_key = f"{request.type}_{request.organism.generation}_{len(request.organism.capabilities)}"
         # Remove organism-specific data before caching
         cacheable_response = {k: v for k, v in response.items() 
-                            if k not in ['organism_id', 'timestamp']}
-        self.cached_responses[cache_key] = cacheable_response
+                            if k not in ('organism_id', 'timestamp')}
+        self.cached_responses[request.cache_key] = cacheable_response
+        self.cached_responses.move_to_end(request.cache_key)
+        if len(self.cached_responses) > self.cache_capacity:
+            self.cached_responses.popitem(last=False)
     
     def prioritize_help(self, requests: List[HelpRequest]) -> List[HelpRequest]:
         """Sort requests by priority: dying organisms first, new problems second, repeated questions last"""
         
         # Sort by multiple criteria: urgency (desc), novelty (desc), generation (asc - younger first)
-        sorted_requests = sorted(requests, 
-            key=lambda r: (-r.urgency, -r.novelty, r.generation))
+        sorted_requests = sorted(requests, key=_request_priority)
         
         return sorted_requests
     
@@ -188,13 +259,12 @@ class ParentEconomy:
         refused_count = 0
         
         for request in sorted_requests:
-            # Check if we can use cached response first
-            if self.can_use_cached_response(request):
-                cached_response = self.get_cached_response(request)
-                if cached_response:
-                    self.send_cached_help(request, cached_response)
-                    cached_count += 1
-                    continue
+            # Check if we can use cached response first (a single cache lookup)
+            cached_response = self.get_cached_response(request)
+            if cached_response:
+                self.send_cached_help(request, cached_response)
+                cached_count += 1
+                continue
             
             # Check if we have budget for LLM call
             if self.used_budget_today >= self.daily_help_budget:
@@ -221,9 +291,9 @@ class ParentEconomy:
     def send_cached_help(self, request: HelpRequest, response: Dict):
         """Send cached help response to organism"""
         # Simulate sending help (in real system would call organism's learn_from_parent)
-        print(f"📚 Cached help sent to {request.organism_id}: {response.get('hint', 'generic_help')}")
+        if self.verbose:
+            print(f"📚 Cached help sent to {request.organism_id}: {response.get('hint', 'generic_help')}")
         try:
-            from genesis.stream import doom_feed
             doom_feed.add('parent_help', f"cached tip for {request.organism_id}", 1)
         except Exception:
             pass
@@ -262,9 +332,9 @@ class ParentEconomy:
                 'encouragement': 'learning_takes_time'
             })
         
-        print(f"🧠 LLM help generated for {request.organism_id}: {request.type}")
+        if self.verbose:
+            print(f"🧠 LLM help generated for {request.organism_id}: {request.type}")
         try:
-            from genesis.stream import doom_feed
             doom_feed.add('parent_help', f"new advice for {request.organism_id}", 2)
         except Exception:
             pass
@@ -272,16 +342,10 @@ class ParentEconomy:
     
     def refuse_help(self, request: HelpRequest, reason: str):
         """Politely refuse help request"""
-        reasons = {
-            'budget_exhausted': "Parent is tired today, try tomorrow",
-            'too_advanced': "You need to grow more first",
-            'repeated_question': "You already know this answer"
-        }
-        
-        message = reasons.get(reason, "Cannot help right now")
-        print(f"❌ Help refused for {request.organism_id}: {message}")
+        message = self.REFUSAL_REASONS.get(reason, "Cannot help right now")
+        if self.verbose:
+            print(f"❌ Help refused for {request.organism_id}: {message}")
         try:
-            from genesis.stream import doom_feed
             doom_feed.add('parent_refusal', f"{request.organism_id}: {message}", 2)
         except Exception:
             pass
@@ -293,13 +357,17 @@ class ParentHelp:
         self.help_requests = []
         self.teaching_history = {}
         self.economy = ParentEconomy()  # Use the new economy system
+        # Queue bound between batch passes: a few days' worth of budget
+        self.max_queued_requests = 10 * self.economy.daily_help_budget
+        # Queue depth that triggers a batch pass before the regular cadence
+        self.batch_high_water = 32
         
     def child_asks_for_help(self, organism, request_type: str, context: Dict):
         """Child encounters something it can't handle"""
         
         # Create help request object
         help_request = HelpRequest(organism, request_type, context)
-        self.help_requests.append(help_request)
+        self.queue_request(help_request)
         
         # Process immediately if urgent, or batch for later processing
         if help_request.urgency > 0.8:
@@ -310,6 +378,29 @@ class ParentHelp:
             # Add to batch for processing
             return {'queued': True, 'message': 'Help request received, will process soon'}
     
+    def queue_request(self, help_request: HelpRequest):
+        """Queue a request for the next batch pass, dropping the lowest-priority
+        request (the newest among equals) once the queue is full"""
+        # Kept in the order prioritize_help sorts in, ties in arrival order,
+        # so the request the batch pass would reach last is always at the end
+        queue = self.help_requests
+        bisect.insort_right(queue, help_request, key=_request_priority)
+        if len(queue) > self.max_queued_requests:
+            queue.pop()
+    
+    def batch_ready(self) -> bool:
+        """Enough requests are queued to process them without waiting"""
+        # A cap below the high-water mark would otherwise hold the queue full
+        # and evicting until the regular cadence
+        return len(self.help_requests) >= min(self.batch_high_water, self.max_queued_requests)
+    
+    def process_batch_if_due(self, day: int, interval: int = 10):
+        """Process queued requests on the regular cadence, or early when a
+        burst of requests has filled the queue"""
+        if day % interval == 0 or self.batch_ready():
+            return self.process_batch_requests()
+        return None
+    
     def get_response_for_organism(self, help_request: HelpRequest) -> Dict:
         """Get appropriate response for organism's help request"""
         # This would be populated by the economy system
@@ -418,7 +509,6 @@ class _TradeBoard:
             self.leads.append(entry)
             if len(self.leads) > self.max_items:
                 self.leads = self.leads[-self.max_items:]
-            from genesis.stream import doom_feed
             kind = getattr(food_type, 'value', str(food_type)) if food_type is not None else (hint or 'hint')
             region_tag = f" [{region}]" if region else ''
             doom_feed.add('lead', f"{organism_id} posted lead: {kind} from {source}{region_tag}", 1, {'organism': organism_id})
@@ -444,15 +534,75 @@ class _TradeBoard:
 # Singleton trade board
 trade_board = _TradeBoard()
 
+# Brain interface genes never pruned by experience-driven adaptation
+_CORE_SENSORS = frozenset({'energy', 'frustration', 'memory_load', 'scarcity', 'age', 'capability_density'})
+_CORE_ACTUATORS = frozenset({'explore', 'conserve', 'social'})
+# Capability unlock rules as (required capabilities, predicate, unlock), in
+# the order check_unlock_conditions reports them.
+# ASK_PARENT is not listed: it is unlocked through frustration-based learning only.
+_UNLOCK_RULES = (
+    # Basic unlocks
+    (frozenset({Capability.EAT_TEXT}), lambda o: o.memory_usage() > 50, Capability.REMEMBER),
+    (frozenset({Capability.EAT_TEXT}), lambda o: o.age > 100, Capability.PATTERN_MATCH),
+    # Communication unlocks
+    (frozenset({Capability.PATTERN_MATCH}), lambda o: o.social_interactions > 10, Capability.SIGNAL),
+    # Advanced unlocks
+    (frozenset({Capability.REMEMBER, Capability.PATTERN_MATCH}),
+     lambda o: o.successful_predictions > 5, Capability.PREDICT),
+    (frozenset({Capability.REMEMBER, Capability.PATTERN_MATCH}),
+     lambda o: o.traits.creativity > 0.5, Capability.CREATE),
+    # Code manipulation unlocks (very rare)
+    (frozenset({Capability.ABSTRACT, Capability.CREATE}),
+     lambda o: o.introspection_attempts > 20, Capability.READ_SELF),
+    (frozenset({Capability.ABSTRACT, Capability.CREATE, Capability.READ_SELF}),
+     lambda o: True, Capability.MODIFY_PARAM),
+)
+# Capability a situation calls for (can_process); other situations need none
+_SITUATION_CAPABILITY = {
+    'complex_data': Capability.ABSTRACT,
+    'social_signal': Capability.RECEIVE,
+    'danger': Capability.PREDICT,
+}
+# Optional sensors dropped when their signal is consistently absent
+_PRUNE_CANDIDATES = ('availability_code', 'availability_structured', 'freshness_expectation', 'toxicity_buildup')
+# Guardrails against unbounded interface growth (bloat)
+_MAX_SENSORS = 16
+_MAX_ACTUATORS = 12
+# Experiences an organism keeps; older ones are forgotten first. Larger than
+# any window read from memory (at most the last 100 entries)
+_MEMORY_CAPACITY = 256
+
+
+def _signal_absent(val) -> bool:
+    """A sensor reading that is missing or exactly zero."""
+    # Cheap equality first; the type check only runs for zero-valued readings
+    return val is None or (val == 0.0 and isinstance(val, (int, float)))
+
 class Organism:
     """A digital life form that evolves.
     TODO: Integrate evolvable BrainGenome & Brain structures:
       - initialize self.brain_genome = BrainGenome.random()
       - initialize self.brain = Brain(self.brain_genome)
       - replace hard-coded sensing/acting with self.brain.forward(...)"""
+
+    # Per-tick state read by live() and the behavior methods. '__dict__' stays
+    # available for the ad-hoc attributes other subsystems attach to organisms.
+    __slots__ = (
+        '__dict__',
+        'id', 'generation', 'age', 'energy', 'traits', 'capabilities',
+        'knowledge_base', '_data_processor', '_brain_drives', '_behavior_modifiers',
+        '_problem_solver', '_last_sensor_map', '_lead_context', 'last_digestion',
+        'preferred_food_types', 'good_food_memories', 'foraging_success_rate',
+        'energy_efficiency', 'frustration', 'memory', '_milestones', 'known_stories',
+        'organisms_taught', '_can_reproduce_cached',
+        '_adapt_trigger_key', 'current_fitness',
+    )
     
-    def __init__(self, generation=0, parent_genome=None):
-        self.id = hashlib.md5(str(random.random()).encode()).hexdigest()[:8]
+    def __init__(self, generation=0, parent_genome=None, parent_connection=None):
+        # 8 hex chars of random id from the global stream, so random.seed()
+        # reproduces ids (and the lexicon seeded from them); 64 bits are drawn
+        # so the generator advances exactly as the former random() draw did
+        self.id = format(random.getrandbits(64) >> 32, '08x')
         self.generation = generation
         self.age = 0
         self.energy = 100
@@ -463,13 +613,15 @@ class Organism:
             Capability.PATTERN_MATCH,  # Essential for RSS/XML data
             Capability.MOVE  # Essential for foraging
         }
-        self.memory = []
+        self.memory = deque(maxlen=_MEMORY_CAPACITY)
         self.code_segments = {}
-        self.parent_connection = ParentHelp()
+        # Drivers pass one ParentHelp so the whole zoo shares its response
+        # cache, daily budget and help queue; standalone organisms get their own
+        self.parent_connection = (parent_connection if parent_connection is not None
+                                  else ParentHelp())
         
         # Initialize simple evolvable brain
         try:
-            from genesis.brain import BrainGenome, Brain
             self.brain_genome = BrainGenome.random()
             self.brain = Brain(self.brain_genome)
         except Exception:
@@ -512,6 +664,29 @@ class Organism:
         self._social_bias = None  # short-horizon imitation (types, strength, ttl)
         # Task 9: self-modification manager (lazy)
         self._self_modify_manager = None
+        # Knowledge, drives and foraging memory (filled in while living)
+        self.knowledge_base = None
+        self._data_processor = None
+        self._brain_drives = {}
+        self._behavior_modifiers = {
+            'tech_awareness': 0.0,
+            'trend_following': 0.0,
+            'code_affinity': 0.0,
+            'emotional_state': 'neutral',
+            'social_preference': 0.5,
+            'curiosity_boost': 0.0
+        }
+        self._problem_solver = False
+        self._last_sensor_map = {}
+        self._lead_context = None
+        self.last_digestion = None
+        self.preferred_food_types = []
+        self.good_food_memories = []
+        self.foraging_success_rate = 0.5
+        # Reproduction readiness snapshot, refreshed by build_mate_index
+        self._can_reproduce_cached = False
+        # Inputs seen by the last interface adaptation that changed nothing
+        self._adapt_trigger_key = None
 
         # Emergent lexicon per lineage for lightweight proto-language tokens
         try:
@@ -545,6 +720,12 @@ class Organism:
         """Calculate current memory usage"""
         return len(self.memory)
     
+    def recent_memories(self, n: int) -> List:
+        """The last n memories, oldest first"""
+        recent = list(islice(reversed(self.memory), n))
+        recent.reverse()
+        return recent
+    
     def sense_environment(self, data_ecosystem=None) -> Dict:
         """Detect what's around the organism"""
         if data_ecosystem:
@@ -664,11 +845,12 @@ class Organism:
     
     def get_emotional_state(self) -> str:
         """Get organism's current emotional/learning state"""
-        if self.frustration > 0.8:
+        frustration = self.frustration
+        if frustration > 0.8:
             return "desperate" 
-        elif self.frustration > 0.6:
+        elif frustration > 0.6:
             return "frustrated"
-        elif self.frustration > 0.3:
+        elif frustration > 0.3:
             return "struggling"
         elif self.consecutive_failures > 0:
             return "challenged"
@@ -718,7 +900,7 @@ class Organism:
         """Teach basic survival to offspring"""
         if self.has_capability(Capability.TEACH):
             # Share some memory with child
-            child.memory.extend(self.memory[-5:])
+            child.memory.extend(self.recent_memories(5))
     
     def analyze_successful_patterns(self) -> List[str]:
         """Analyze what has worked well"""
@@ -742,6 +924,8 @@ class Organism:
         
         # Use brain to derive simple drives from state + ecosystem + nutrition
         self._compute_brain_drives(data_ecosystem, nutrition_system)
+        drives = self._brain_drives
+        conserve = drives.get('conserve', 0.0)
         
         # Number of foraging attempts based on capabilities and desperation
         base_attempts = 1
@@ -752,29 +936,27 @@ class Organism:
         if self.energy < 30:
             base_attempts += 2  # Desperation = more searching
         # Brain exploration drive gives bonus attempts
-        if getattr(self, '_brain_drives', None):
-            exp = self._brain_drives.get('explore', 0.0)
+        if drives:
+            exp = drives.get('explore', 0.0)
             if exp > 0.5:
                 base_attempts += 1
             if exp > 0.8:
                 base_attempts += 1
             # High conserve drive reduces unnecessary searching when safe
-            if self.energy > 40 and self._brain_drives.get('conserve', 0.0) > 0.8:
+            if self.energy > 40 and conserve > 0.8:
                 base_attempts = max(1, base_attempts - 1)
         # Competition-aware adjustment using last sensor snapshot (higher scarcity/competition -> try a bit harder)
         try:
-            comp = 0.0
-            if hasattr(self, '_last_sensor_map'):
-                comp = float(self._last_sensor_map.get('competition_local', 0.0))
+            comp = float(self._last_sensor_map.get('competition_local', 0.0))
             if comp > 0.75 and base_attempts < 4:
                 base_attempts += 1
-            elif comp < 0.25 and base_attempts > 1 and getattr(self, '_brain_drives', {}).get('conserve', 0.0) > 0.6:
+            elif comp < 0.25 and base_attempts > 1 and conserve > 0.6:
                 base_attempts = max(1, base_attempts - 1)
         except Exception:
             pass
         # Migration action: switch virtual regions when scarcity and drive are high
-        if getattr(self, '_brain_drives', None):
-            mig = self._brain_drives.get('migrate', 0.0)
+        if drives:
+            mig = drives.get('migrate', 0.0)
             try:
                 eco = data_ecosystem.get_ecosystem_stats() if data_ecosystem else {}
                 scarcity_flag = (eco.get('food_scarcity', 1.0) or 1.0) < 0.5
@@ -784,13 +966,12 @@ class Organism:
             if force_mig or (mig > 0.75 and scarcity_flag and random.random() < 0.25):
                 prev = self.current_region
                 # Choose destination based on other drives
-                drives = self._brain_drives
                 target = prev
                 if drives.get('prefer_structured', 0.0) > 0.6:
                     target = 'structured-rich'
                 elif drives.get('risk', 0.0) > 0.7:
                     target = 'code-rich'
-                elif drives.get('conserve', 0.0) > 0.6:
+                elif conserve > 0.6:
                     target = 'text-meadow'
                 if target == prev and force_mig:
                     # Pick an alternate region deterministically for testing
@@ -803,8 +984,7 @@ class Organism:
                 if target != prev:
                     self.current_region = target
                     try:
-                        from genesis.stream import doom_feed
-                        doom_feed.add('migration', f"{self.id} migrated {prev}→{target}", 2, {'organism': self.id})
+                        self._feed('migration', f"{self.id} migrated {prev}→{target}", 2, {'organism': self.id})
                     except Exception:
                         pass
         
@@ -834,9 +1014,6 @@ class Organism:
             self._learn_foraging_patterns(foraging_patterns)
         
         # Track foraging success for evolution
-        if not hasattr(self, 'foraging_success_rate'):
-            self.foraging_success_rate = 0.5
-        
         if base_attempts > 0:
             success_rate = successful_forages / base_attempts
             # Update running average
@@ -853,7 +1030,7 @@ class Organism:
         """
         # Vocabulary grows with knowledge and age
         insights = 0
-        if getattr(self, 'knowledge_base', None):
+        if self.knowledge_base:
             try:
                 insights = int(self.knowledge_base.get_knowledge_summary().get('total_insights', 0))
             except Exception:
@@ -866,7 +1043,7 @@ class Organism:
         concept_ids = []
         for a, v in top_acts:
             try:
-                if getattr(self, 'lexicon', None):
+                if self.lexicon:
                     bucket = 'low' if v < 0.33 else ('mid' if v < 0.66 else 'high')
                     cid = f"{a}:{bucket}"
                     w = self.lexicon.get_or_mint(cid)
@@ -910,8 +1087,8 @@ class Organism:
             phrases.append(tail)
         # Reinforce lexicon words based on last digestion quality proxy
         try:
-            if getattr(self, 'lexicon', None) and concept_ids:
-                success = bool(getattr(self, 'last_Q', 0.0) > 0.0)
+            if self.lexicon and concept_ids:
+                success = bool(self.last_Q > 0.0)
                 for cid in concept_ids:
                     self.lexicon.reinforce(cid, success=success)
         except Exception:
@@ -923,7 +1100,7 @@ class Organism:
 
         Returns a small list of frequent tokens (lowercased), excluding stopwords.
         """
-        kb = getattr(self, 'knowledge_base', None)
+        kb = self.knowledge_base
         if not kb or not hasattr(kb, 'knowledge_items') or not kb.knowledge_items:
             return []
         try:
@@ -954,11 +1131,11 @@ class Organism:
         Produces a dict with keys like 'explore' and 'social'.
         """
         if not self.brain:
-            self._brain_drives = None
+            self._brain_drives = {}
             return
         # Build input vector from brain sensors gene list
         energy_norm = max(0.0, min(1.0, self.energy / 100.0))
-        frustration = max(0.0, min(1.0, getattr(self, 'frustration', 0.0)))
+        frustration = max(0.0, min(1.0, self.frustration))
         memory_load = max(0.0, min(1.0, len(self.memory) / 100.0))
         scarcity = 1.0
         if data_ecosystem:
@@ -966,7 +1143,7 @@ class Organism:
             scarcity = 1.0 - max(0.0, min(1.0, eco.get('food_scarcity', 1.0)))
         age_norm = max(0.0, min(1.0, self.age / 500.0))
         cap_norm = max(0.0, min(1.0, len(self.capabilities) / 10.0))
-        recent_success = getattr(self, 'foraging_success_rate', 0.5)
+        recent_success = self.foraging_success_rate
         sensor_map = {
             'energy': energy_norm,
             'frustration': frustration,
@@ -980,7 +1157,7 @@ class Organism:
         try:
             wins = 0
             fails = 0
-            if getattr(self, 'social_observations', None):
+            if self.social_observations:
                 for ob in self.social_observations[-10:]:
                     out = (ob.get('outcome') or {}) if isinstance(ob, dict) else {}
                     if out.get('success') is True or float(out.get('energy', 0.0)) > 4.0:
@@ -1045,23 +1222,22 @@ class Organism:
             # Occasionally surface high-level intent in the doom feed for readability
             try:
                 if random.random() < 0.05:
-                    from genesis.stream import doom_feed
                     top = sorted(drives.items(), key=lambda kv: kv[1], reverse=True)
                     if top:
                         k, v = top[0]
-                        doom_feed.add('intent', f"{self.id} drive: {k}={v:.2f}", 1, {'organism': self.id})
+                        self._feed('intent', f"{self.id} drive: {k}={v:.2f}", 1, {'organism': self.id})
             except Exception:
                 pass
         except Exception:
-            self._brain_drives = None
+            self._brain_drives = {}
 
     def _get_interface_adapt_rate(self) -> float:
         """Dynamic probability to adapt interfaces based on recent performance.
 
         Higher when struggling; lower when succeeding to stabilize beneficial I/O.
         """
-        base = getattr(self, 'interface_adaptation_rate', 0.25)
-        fsr = getattr(self, 'foraging_success_rate', 0.5)
+        base = self.interface_adaptation_rate
+        fsr = self.foraging_success_rate
         # Struggling: increase chance to adapt
         if fsr < 0.3 or self.energy < 50:
             base = min(0.6, base + 0.2)
@@ -1070,9 +1246,7 @@ class Organism:
             base = max(0.05, base - 0.15)
         # Toxicity high -> slight increase to add metabolic sensors
         try:
-            tox = 0.0
-            if hasattr(self, '_last_sensor_map'):
-                tox = float(self._last_sensor_map.get('toxicity_buildup', 0.0))
+            tox = float(self._last_sensor_map.get('toxicity_buildup', 0.0))
             if tox > 0.6:
                 base = min(0.6, base + 0.1)
         except Exception:
@@ -1082,7 +1256,9 @@ class Organism:
     def _explore_for_food(self, data_ecosystem, attempt_number, nutrition_system=None):
         """Single foraging exploration attempt"""
         # Use a weighted preference strategy derived from drives and memory
-        from data_sources.harvesters import DataType
+        drives = self._brain_drives
+        conserve = drives.get('conserve', 0.0)
+        risk = drives.get('risk', 0.0)
 
         preferred_types = self._choose_preferred_types(n=2, data_ecosystem=data_ecosystem, nutrition_system=nutrition_system)
 
@@ -1090,17 +1266,14 @@ class Organism:
         if attempt_number == 0:
             # Build preferences informed by brain drives, metabolic state, and body parts
             prefs = {'preferred_types': preferred_types} if preferred_types else {}
-            drives = getattr(self, '_brain_drives', {}) or {}
             # Difficulty: conserve prefers easy, risk prefers challenging
-            if drives.get('conserve', 0.0) > 0.6 and drives.get('risk', 0.0) < 0.6:
+            if conserve > 0.6 and risk < 0.6:
                 prefs['difficulty_preference'] = 'low'
-            elif drives.get('risk', 0.0) > 0.7 and drives.get('conserve', 0.0) < 0.6:
+            elif risk > 0.7 and conserve < 0.6:
                 prefs['difficulty_preference'] = 'high'
             # Metabolic efficiency nudges difficulty
             try:
-                me = 0.7
-                if hasattr(self, '_last_sensor_map'):
-                    me = max(0.0, min(1.0, float(self._last_sensor_map.get('metabolic_efficiency', 0.7))))
+                me = max(0.0, min(1.0, float(self._last_sensor_map.get('metabolic_efficiency', 0.7))))
                 if me < 0.4:
                     prefs['difficulty_preference'] = 'low'
                 elif me > 0.8 and drives.get('risk', 0.0) > 0.6:
@@ -1109,7 +1282,7 @@ class Organism:
                 pass
             # Apply region preference to leverage virtual habitats
             try:
-                if hasattr(self, 'current_region') and self.current_region:
+                if self.current_region:
                     prefs['region'] = self.current_region
             except Exception:
                 pass
@@ -1125,9 +1298,7 @@ class Organism:
                 pass
             # Novelty hunger reduces freshness threshold slightly to explore more
             try:
-                novelty = 0.0
-                if hasattr(self, '_last_sensor_map'):
-                    novelty = max(0.0, min(1.0, float(self._last_sensor_map.get('novelty_hunger', 0.0))))
+                novelty = max(0.0, min(1.0, float(self._last_sensor_map.get('novelty_hunger', 0.0))))
                 if novelty > 0.5:
                     min_fresh = max(0.0, min_fresh - 0.1 * (novelty - 0.5) * 2.0)
             except Exception:
@@ -1141,9 +1312,7 @@ class Organism:
                     prefs['toxicity_avoid_code'] = True
             # Competition-aware freshness tuning: under high competition, be less picky; under low + conserve, be pickier
             try:
-                comp = 0.0
-                if hasattr(self, '_last_sensor_map'):
-                    comp = max(0.0, min(1.0, float(self._last_sensor_map.get('competition_local', 0.0))))
+                comp = max(0.0, min(1.0, float(self._last_sensor_map.get('competition_local', 0.0))))
                 if comp > 0.7:
                     prefs['min_freshness'] = max(0.0, prefs.get('min_freshness', 0.0) - 0.05 * (comp - 0.7) * 3.0)
                 elif comp < 0.3 and drives.get('conserve', 0.0) > 0.6:
@@ -1152,13 +1321,13 @@ class Organism:
                 pass
             # Apply body part biases to preferences
             try:
-                if getattr(self, 'body', None) is not None:
+                if self.body is not None:
                     prefs = self.body.apply_foraging_preferences(prefs)
             except Exception:
                 pass
             # Use trade board lead to bias first attempt if available
             if drives.get('trade', 0.0) > 0.6:
-                my_region = getattr(self, 'current_region', None)
+                my_region = self.current_region
                 leads = trade_board.get_recent_leads(region=my_region)
                 if leads:
                     last = leads[-1]
@@ -1171,7 +1340,6 @@ class Organism:
                         else:
                             # Interpret hint-only leads
                             hint = (last.get('hint') or '').lower()
-                            from data_sources.harvesters import DataType
                             if 'prefer_structured' in hint:
                                 prefs['preferred_types'] = [DataType.STRUCTURED_JSON, DataType.XML_DATA]
                                 self._lead_context = {'hint': 'prefer_structured'}
@@ -1186,21 +1354,20 @@ class Organism:
             # Occasionally surface strategy in feed to make logs interesting
             try:
                 if prefs and random.random() < 0.2:
-                    from genesis.stream import doom_feed
                     label = ','.join(t.value for t in preferred_types)
                     msg = f"{self.id} seeks {label}"
                     if 'difficulty_preference' in prefs:
                         msg += f" diff={prefs['difficulty_preference']}"
                     if 'min_freshness' in prefs:
                         msg += f" fresh>{prefs['min_freshness']:.2f}"
-                    doom_feed.add('strategy', msg, 1, {'organism': self.id})
-                    if getattr(self, 'knowledge_base', None) and random.random() < 0.5:
-                        doom_feed.add('intellect', f"{self.id} strategy shaped by knowledge", 1, {'organism': self.id})
+                    self._feed('strategy', msg, 1, {'organism': self.id})
+                    if self.knowledge_base and random.random() < 0.5:
+                        self._feed('intellect', f"{self.id} strategy shaped by knowledge", 1, {'organism': self.id})
             except Exception:
                 pass
             # Try via limb action if available (consumes if successful)
             try:
-                if getattr(self, 'body', None) is not None:
+                if self.body is not None:
                     res = self.body.call_action('grasp_consume', organism=self, data_ecosystem=data_ecosystem, nutrition_system=nutrition_system, preferences=prefs)
                     if isinstance(res, dict) and res.get('ok'):
                         return None
@@ -1212,31 +1379,30 @@ class Organism:
             if self.has_capability(Capability.PATTERN_MATCH):
                 if preferred_types and len(preferred_types) > 1:
                     return data_ecosystem.find_food_for_organism(self.capabilities, {'preferred_types': [preferred_types[1]]})
-                if getattr(self, '_brain_drives', None) and self._brain_drives.get('risk', 0.0) > 0.7:
+                if risk > 0.7:
                     return data_ecosystem.find_food_for_organism(self.capabilities, {'preferred_types': [DataType.CODE]})
         elif attempt_number == 2:
             # Memory-based foraging - try to remember good food sources
-            if self.has_capability(Capability.REMEMBER) and hasattr(self, 'good_food_memories'):
+            if self.has_capability(Capability.REMEMBER):
                 for memory in self.good_food_memories[-3:]:  # Last 3 good experiences
                     food = data_ecosystem.find_food_for_organism(self.capabilities)
                     if food and food.data_type == memory.get('food_type'):
                         return food
             # fallback to first preference
             if preferred_types:
-                drives = getattr(self, '_brain_drives', {}) or {}
                 prefs = {'preferred_types': [preferred_types[0]]}
-                if drives.get('conserve', 0.0) > 0.6:
+                if conserve > 0.6:
                     prefs['difficulty_preference'] = 'low'
                     prefs['min_freshness'] = 0.5
                 # Apply body preferences again
                 try:
-                    if getattr(self, 'body', None) is not None:
+                    if self.body is not None:
                         prefs = self.body.apply_foraging_preferences(prefs)
                 except Exception:
                     pass
                 # Try limb-based consumption again with refined prefs
                 try:
-                    if getattr(self, 'body', None) is not None:
+                    if self.body is not None:
                         res = self.body.call_action('grasp_consume', organism=self, data_ecosystem=data_ecosystem, nutrition_system=nutrition_system, preferences=prefs)
                         if isinstance(res, dict) and res.get('ok'):
                             return None
@@ -1245,7 +1411,7 @@ class Organism:
                 return data_ecosystem.find_food_for_organism(self.capabilities, prefs)
         else:
             # Desperate exploration
-            if getattr(self, '_brain_drives', None) and self._brain_drives.get('risk', 0.0) > 0.6:
+            if risk > 0.6:
                 return data_ecosystem.find_food_for_organism(self.capabilities, {'preferred_types': [DataType.CODE, DataType.XML_DATA]})
             return data_ecosystem.find_food_for_organism(self.capabilities)
         
@@ -1254,7 +1420,7 @@ class Organism:
     # Body integration for digestion metrics
     def get_body_digestion_mods(self) -> dict:
         try:
-            if getattr(self, 'body', None) is None:
+            if self.body is None:
                 return {}
             return self.body.aggregation_digestion_mods()
         except Exception:
@@ -1263,7 +1429,7 @@ class Organism:
     # Convenience: organism-level limb API
     def use_limb(self, action: str, **kwargs) -> dict:
         try:
-            if getattr(self, 'body', None) is None:
+            if self.body is None:
                 return {"ok": False, "error": "no_body"}
             return self.body.call_action(action, organism=self, **kwargs)
         except Exception as e:
@@ -1284,8 +1450,7 @@ class Organism:
                 self.last_Q = 0.0
             # Reinforcement for simple path
             try:
-                if hasattr(self, '_lead_context') and self._lead_context:
-                    from data_sources.harvesters import DataType
+                if self._lead_context:
                     ctx = self._lead_context
                     matched = False
                     if 'type' in ctx and isinstance(ctx['type'], DataType):
@@ -1302,13 +1467,11 @@ class Organism:
                             matched = True
                     if matched:
                         try:
-                            from genesis.stream import doom_feed
-                            doom_feed.add('lead_success', f"{self.id} validated a shared lead", 1, {'organism': self.id})
+                            self._feed('lead_success', f"{self.id} validated a shared lead", 1, {'organism': self.id})
                         except Exception:
                             pass
             finally:
-                if hasattr(self, '_lead_context'):
-                    self._lead_context = None
+                self._lead_context = None
             return
         
         # Advanced nutritional processing
@@ -1332,8 +1495,7 @@ class Organism:
                 # Build sensor map covering known brain sensors; default zeros
                 sensor_map = {}
                 # Baseline signals if previously computed
-                if hasattr(self, '_last_sensor_map') and isinstance(self._last_sensor_map, dict):
-                    sensor_map.update(self._last_sensor_map)
+                sensor_map.update(self._last_sensor_map)
                 # Data-specific sensors (normalized)
                 ev = float(getattr(food_morsel, 'energy_value', energy_gained))
                 size = float(getattr(food_morsel, 'size', 0) or 0)
@@ -1359,9 +1521,8 @@ class Organism:
                 top = sorted(out.items(), key=lambda kv: kv[1], reverse=True)[:3]
                 self.last_digestion = {'type': food_morsel.data_type.value, 'top': top, 'all': out}
                 try:
-                    from genesis.stream import doom_feed
                     desc = ", ".join(f"{k}={v:.2f}" for k, v in top)
-                    doom_feed.add('digestion', f"{self.id} digested {food_morsel.data_type.value} -> {desc}", 1,
+                    self._feed('digestion', f"{self.id} digested {food_morsel.data_type.value} -> {desc}", 1,
                                   {'organism': self.id})
                 except Exception:
                     pass
@@ -1369,7 +1530,7 @@ class Organism:
                 try:
                     msg = self._brain_talk_from_acts(top)
                     try:
-                        doom_feed.add('chatter', f"{self.id}: {msg}", 1, {'organism': self.id})
+                        self._feed('chatter', f"{self.id}: {msg}", 1, {'organism': self.id})
                     except Exception:
                         pass
                 except Exception:
@@ -1380,8 +1541,7 @@ class Organism:
 
         # Reinforcement: if this success followed a trade/teaching lead, record it and surface
         try:
-            if hasattr(self, '_lead_context') and self._lead_context:
-                from data_sources.harvesters import DataType
+            if self._lead_context:
                 ctx = self._lead_context
                 matched = False
                 if 'type' in ctx and isinstance(ctx['type'], DataType):
@@ -1398,20 +1558,15 @@ class Organism:
                         matched = True
                 if matched:
                     try:
-                        from genesis.stream import doom_feed
-                        doom_feed.add('lead_success', f"{self.id} validated a shared lead", 1, {'organism': self.id})
+                        self._feed('lead_success', f"{self.id} validated a shared lead", 1, {'organism': self.id})
                     except Exception:
                         pass
         finally:
             # Clear lead context regardless of match
-            if hasattr(self, '_lead_context'):
-                self._lead_context = None
+            self._lead_context = None
         
         # Remember good food sources
         if energy_gained > 8 and self.has_capability(Capability.REMEMBER):
-            if not hasattr(self, 'good_food_memories'):
-                self.good_food_memories = []
-            
             self.good_food_memories.append({
                 'food_type': food_morsel.data_type,
                 'energy_gained': energy_gained,
@@ -1427,7 +1582,7 @@ class Organism:
         learning_boost = 0.02
         knowledge_bonus = ""
         
-        if hasattr(self, 'knowledge_base') and self.knowledge_base.insights_generated > 0:
+        if self.knowledge_base and self.knowledge_base.insights_generated > 0:
             learning_boost += 0.01  # Extra boost for learning from real data
             knowledge_bonus = f" (knowledge: {self.knowledge_base.insights_generated} insights)"
         
@@ -1439,7 +1594,7 @@ class Organism:
         
         # Show what the organism actually learned
         recent_insights = ""
-        if hasattr(self, 'knowledge_base') and self.knowledge_base and hasattr(self.knowledge_base, 'knowledge_items'):
+        if self.knowledge_base and hasattr(self.knowledge_base, 'knowledge_items'):
             if self.knowledge_base.knowledge_items:
                 latest = self.knowledge_base.knowledge_items[-1]
                 recent_insights = f"\n   🧠 Learned: {latest.content}"
@@ -1478,7 +1633,6 @@ class Organism:
             self._trust_map[neighbor_id] = max(0.0, min(1.0, cur + delta))
             # Seed imitation bias based on observed food type
             try:
-                from data_sources.harvesters import DataType
                 t = None
                 ct = (context or {}).get('food_type') or (context or {}).get('type')
                 if isinstance(ct, DataType):
@@ -1487,8 +1641,7 @@ class Organism:
                     strength = 0.35 + 0.25 * self._trust_map.get(neighbor_id, 0.5)
                     self._social_bias = {'types': [t], 'strength': strength, 'ttl': 3}
                     try:
-                        from genesis.stream import doom_feed
-                        doom_feed.add('imitate', f"{self.id} observed {neighbor_id} succeed with {t.value}", 1,
+                        self._feed('imitate', f"{self.id} observed {neighbor_id} succeed with {t.value}", 1,
                                       {'organism': self.id})
                     except Exception:
                         pass
@@ -1510,9 +1663,7 @@ class Organism:
 
     def _choose_preferred_types(self, n=2, data_ecosystem=None, nutrition_system=None):
         """Choose preferred DataTypes based on brain drives, successes, ecosystem, and metabolic state."""
-        try:
-            from data_sources.harvesters import DataType
-        except Exception:
+        if DataType is None:
             return []
 
         # Base weights
@@ -1523,13 +1674,14 @@ class Organism:
             DataType.CODE: 0.15,
         }
         # Brain drives
-        if getattr(self, '_brain_drives', None):
-            ds = self._brain_drives
-            weights[DataType.STRUCTURED_JSON] += 0.5 * ds.get('prefer_structured', 0.0)
-            weights[DataType.CODE] += 0.5 * (0.5 * ds.get('prefer_structured', 0.0) + ds.get('risk', 0.0))
-            weights[DataType.XML_DATA] += 0.2 * ds.get('prefer_structured', 0.0)
+        drives = self._brain_drives
+        if drives:
+            structured = drives.get('prefer_structured', 0.0)
+            weights[DataType.STRUCTURED_JSON] += 0.5 * structured
+            weights[DataType.CODE] += 0.5 * (0.5 * structured + drives.get('risk', 0.0))
+            weights[DataType.XML_DATA] += 0.2 * structured
         # Memory successes
-        if hasattr(self, 'good_food_memories') and self.good_food_memories:
+        if self.good_food_memories:
             score = {}
             for m in self.good_food_memories[-10:]:
                 t = m.get('food_type')
@@ -1538,7 +1690,7 @@ class Organism:
             for t, s in score.items():
                 weights[t] = weights.get(t, 0.0) + 0.3 * (s / total)
         # Knowledge-influenced preferences (proto "intellectual" modulation)
-        if getattr(self, 'knowledge_base', None):
+        if self.knowledge_base:
             try:
                 summary = self.knowledge_base.get_knowledge_summary()
                 expertise = [e.lower() for e in summary.get('expertise_areas', [])]
@@ -1552,13 +1704,10 @@ class Organism:
             except Exception:
                 pass
         # Novelty seeking vs repetition (scaled by novelty_hunger sensor if available)
-        drives = getattr(self, '_brain_drives', {}) or {}
         explore_drive = drives.get('explore', 0.0)
-        novelty = 0.0
-        if hasattr(self, '_last_sensor_map'):
-            novelty = max(0.0, min(1.0, self._last_sensor_map.get('novelty_hunger', 0.0)))
+        novelty = max(0.0, min(1.0, self._last_sensor_map.get('novelty_hunger', 0.0)))
         recent_types = []
-        if hasattr(self, 'good_food_memories') and self.good_food_memories:
+        if self.good_food_memories:
             recent_types = [m.get('food_type') for m in self.good_food_memories[-5:]]
         if explore_drive > 0.7 or novelty > 0.5:
             for dt in [DataType.SIMPLE_TEXT, DataType.STRUCTURED_JSON, DataType.XML_DATA, DataType.CODE]:
@@ -1573,9 +1722,7 @@ class Organism:
             fbt = eco.get('food_by_type', {})
             total_available = sum(fbt.values()) or 1
             # Competition-aware scaling: under high competition, prefer abundant types more strongly
-            comp = 0.0
-            if hasattr(self, '_last_sensor_map'):
-                comp = max(0.0, min(1.0, float(self._last_sensor_map.get('competition_local', 0.0))))
+            comp = max(0.0, min(1.0, float(self._last_sensor_map.get('competition_local', 0.0))))
             avail_scale = 0.25 * (0.6 + 0.8 * comp)  # 0.15..0.45
             for dt in [DataType.SIMPLE_TEXT, DataType.STRUCTURED_JSON, DataType.XML_DATA, DataType.CODE]:
                 avail = fbt.get(dt.value, 0) / total_available
@@ -1588,7 +1735,7 @@ class Organism:
                         weights[dt] = weights.get(dt, 0.0) + 0.1
         # Task 7: Social imitation bias — tilt toward observed successful types
         try:
-            bias = getattr(self, '_social_bias', None)
+            bias = self._social_bias
             if bias and bias.get('types'):
                 strength = float(bias.get('strength', 0.0))
                 for dt in bias['types']:
@@ -1603,11 +1750,8 @@ class Organism:
                 weights[dt] = weights.get(dt, 0.0) + 0.2 * ts
         # Metabolic adaptability: low efficiency -> prefer simpler/structured; high efficiency -> tolerate more complex
         try:
-            me = 0.7
-            toxin = 0.0
-            if hasattr(self, '_last_sensor_map'):
-                me = max(0.0, min(1.0, float(self._last_sensor_map.get('metabolic_efficiency', 0.7))))
-                toxin = max(0.0, min(1.0, float(self._last_sensor_map.get('toxicity_buildup', 0.0))))
+            me = max(0.0, min(1.0, float(self._last_sensor_map.get('metabolic_efficiency', 0.7))))
+            toxin = max(0.0, min(1.0, float(self._last_sensor_map.get('toxicity_buildup', 0.0))))
             if me < 0.4:
                 weights[DataType.CODE] *= 0.7
                 weights[DataType.SIMPLE_TEXT] = weights.get(DataType.SIMPLE_TEXT, 0.0) + 0.1
@@ -1635,27 +1779,25 @@ class Organism:
                     most = max(pf, key=pf.get)
                     if pf[most] / total > 0.7:
                         # Reduce that most-eaten type
-                        try:
-                            from data_sources.harvesters import DataType as DT
-                            most_enum = DT(most)
+                        most_enum = _DATA_TYPE_BY_VALUE.get(most)
+                        if most_enum in weights:
                             weights[most_enum] *= 0.8
-                        except Exception:
-                            pass
-        # Sort by weight
-        ordered = sorted(weights.items(), key=lambda kv: kv[1], reverse=True)
-        return [t for t, _ in ordered[:n] if _ > 0.0]
+        # Top-n positive weights (nlargest keeps sorted() tie order)
+        positive = [(t, w) for t, w in weights.items() if w > 0.0]
+        return [t for t, _ in heapq.nlargest(n, positive, key=itemgetter(1))]
     
     def _extract_real_knowledge_from_data(self, food_morsel):
         """REAL DATA PROCESSING: Extract actual knowledge from internet data"""
         
+        if create_data_processor is None:
+            return False
+        
         # Create data processor if not exists
-        if not hasattr(self, '_data_processor'):
-            from genesis.data_processor import create_data_processor
+        if self._data_processor is None:
             self._data_processor = create_data_processor()
         
         # Create knowledge base if not exists
-        if not hasattr(self, 'knowledge_base'):
-            from genesis.data_processor import OrganismKnowledgeBase
+        if self.knowledge_base is None:
             self.knowledge_base = OrganismKnowledgeBase()
         
         # Extract real knowledge from the data morsel
@@ -1667,8 +1809,7 @@ class Organism:
                 print(f"🧠 Organism {self.id} learned: {k.content}")
             # Doom feed: knowledge pulse
             try:
-                from genesis.stream import doom_feed
-                doom_feed.add('knowledge', f"{self.id} absorbed {len(knowledge_extracted)} insight(s)", 1,
+                self._feed('knowledge', f"{self.id} absorbed {len(knowledge_extracted)} insight(s)", 1,
                               {'organism': self.id})
             except Exception:
                 pass
@@ -1685,8 +1826,7 @@ class Organism:
                 if insight:
                     print(f"💡 Organism {self.id} insight: {insight}")
                     try:
-                        from genesis.stream import doom_feed
-                        doom_feed.add('insight', f"{self.id} connected dots: {insight}", 2,
+                        self._feed('insight', f"{self.id} connected dots: {insight}", 2,
                                       {'organism': self.id})
                     except Exception:
                         pass
@@ -1695,76 +1835,84 @@ class Organism:
                     if hasattr(self.traits, 'curiosity'):
                         self.traits.curiosity *= 1.02
             
-            # Milestones
-            try:
-                total = self.knowledge_base.get_knowledge_summary()['total_insights']
-                if total >= 1 and 'first_insight' not in self._milestones:
-                    self._milestones.add('first_insight')
-                    self.known_stories.append('first_insight')
-                    from genesis.stream import doom_feed
-                    doom_feed.add('milestone', f"{self.id} had a first insight", 2, {'organism': self.id})
-                if total >= 10 and 'ten_insights' not in self._milestones:
-                    self._milestones.add('ten_insights')
-                    self.known_stories.append('ten_insights')
-                    from genesis.stream import doom_feed
-                    doom_feed.add('milestone', f"{self.id} reached 10 insights", 2, {'organism': self.id})
-            except Exception:
-                pass
+            # Milestones (skip the summary once both have fired)
+            if not ('first_insight' in self._milestones and 'ten_insights' in self._milestones):
+                try:
+                    total = self.knowledge_base.get_knowledge_summary()['total_insights']
+                    if total >= 1:
+                        self._mark_milestone('first_insight', f"{self.id} had a first insight")
+                    if total >= 10:
+                        self._mark_milestone('ten_insights', f"{self.id} reached 10 insights")
+                except Exception:
+                    pass
             return True
         
         return False
     
+    def _mark_milestone(self, name: str, message: str):
+        """Record a one-shot milestone as a story and feed event; repeats are ignored"""
+        if name in self._milestones:
+            return
+        self._milestones.add(name)
+        self.known_stories.append(name)
+        self._feed('milestone', message, 2, {'organism': self.id})
+    
     def get_knowledge_summary(self) -> Dict:
         """Get organism's real knowledge and expertise"""
         
-        if not hasattr(self, 'knowledge_base'):
+        if self.knowledge_base is None:
             return {"status": "no_knowledge", "insights": 0}
         
         return self.knowledge_base.get_knowledge_summary()
     
-    def exhibit_knowledge_based_behaviors(self):
+    def exhibit_knowledge_based_behaviors(self, knowledge_summary: Optional[Dict] = None):
         """EMERGENT BEHAVIORS: Organisms act differently based on their real knowledge"""
 
-        if not hasattr(self, 'knowledge_base'):
+        if self.knowledge_base is None:
             return
         
-        knowledge_summary = self.knowledge_base.get_knowledge_summary()
+        if knowledge_summary is None:
+            knowledge_summary = self.knowledge_base.get_knowledge_summary()
+        
+        total_insights = knowledge_summary['total_insights']
+        expertise_areas = knowledge_summary.get('expertise_areas', [])
         
         # No knowledge yet - default behavior
-        if knowledge_summary['total_insights'] == 0:
+        if total_insights == 0:
             return
         
-        # Initialize behavior modifiers if not present
-        if not hasattr(self, '_behavior_modifiers'):
-            self._behavior_modifiers = {
-                'tech_awareness': 0.0,
-                'trend_following': 0.0,
-                'code_affinity': 0.0,
-                'emotional_state': 'neutral',
-                'social_preference': 0.5,
-                'curiosity_boost': 0.0
-            }
-        
+        # EvolvableTraits defines every trait touched below
+        traits = self.traits
+
         # Get recent knowledge for behavior analysis
-        if hasattr(self.knowledge_base, 'knowledge_items') and self.knowledge_base.knowledge_items:
-            recent_knowledge = self.knowledge_base.knowledge_items[-5:]  # Last 5 insights
+        recent_knowledge = self.knowledge_base.recent_items  # Last 5 insights
+        if recent_knowledge:
             
-            # Analyze knowledge to determine behavioral changes
-            tech_concepts = sum(1 for k in recent_knowledge if k.insight_type.value == 'technical_concept')
-            trending_topics = sum(1 for k in recent_knowledge if k.insight_type.value == 'trending_topic')
-            emotions = [k for k in recent_knowledge if k.insight_type.value == 'human_emotion']
+            # Analyze knowledge to determine behavioral changes (single pass)
+            tech_concepts = 0
+            trending_topics = 0
+            emotions = []
+            code_insights = []
+            for k in recent_knowledge:
+                itv = k.insight_type.value
+                if itv == 'technical_concept':
+                    tech_concepts += 1
+                elif itv == 'trending_topic':
+                    trending_topics += 1
+                elif itv == 'human_emotion':
+                    emotions.append(k)
+                if k.is_code:
+                    code_insights.append(k)
             
             # BEHAVIOR 1: Tech-savvy organisms become more systematic
             if tech_concepts >= 2:
                 self._behavior_modifiers['tech_awareness'] = min(1.0, self._behavior_modifiers['tech_awareness'] + 0.1)
                 
                 # Tech-aware organisms are more efficient at finding structured data
-                if hasattr(self.traits, 'efficiency'):
-                    self.traits.efficiency *= (1.0 + self._behavior_modifiers['tech_awareness'] * 0.05)
+                traits.efficiency *= (1.0 + self._behavior_modifiers['tech_awareness'] * 0.05)
                 
                 # They also become more methodical (less random exploration)
-                if hasattr(self.traits, 'patience'):
-                    self.traits.patience = min(1.0, self.traits.patience + 0.05)
+                traits.patience = min(1.0, traits.patience + 0.05)
                 
                 if self.age % 50 == 0 and self._behavior_modifiers['tech_awareness'] > 0.3:
                     print(f"⚙️ Organism {self.id} shows basic tech familiarity (awareness: {self._behavior_modifiers['tech_awareness']:.2f})")
@@ -1774,12 +1922,10 @@ class Organism:
                 self._behavior_modifiers['trend_following'] = min(1.0, self._behavior_modifiers['trend_following'] + 0.15)
                 
                 # Trend followers are more competitive for fresh data
-                if hasattr(self.traits, 'aggression'):
-                    self.traits.aggression = min(1.0, self.traits.aggression + 0.1)
+                traits.aggression = min(1.0, traits.aggression + 0.1)
                 
                 # They also become more social to share trends
-                if hasattr(self.traits, 'cooperation'):
-                    self.traits.cooperation = min(1.0, self.traits.cooperation + 0.05)
+                traits.cooperation = min(1.0, traits.cooperation + 0.05)
                 
                 if self.age % 50 == 0 and self._behavior_modifiers['trend_following'] > 0.3:
                     # Surface an example token of the detected 'pattern'
@@ -1793,17 +1939,14 @@ class Organism:
                     print(f"📊 Organism {self.id} notices data patterns (pattern recognition: {self._behavior_modifiers['trend_following']:.2f}{sample_tok})")
             
             # BEHAVIOR 3: Code-experienced organisms become more creative and exploratory  
-            code_insights = [k for k in recent_knowledge if 'function' in k.content.lower() or 'import' in k.content.lower()]
             if code_insights:
                 self._behavior_modifiers['code_affinity'] = min(1.0, self._behavior_modifiers['code_affinity'] + 0.1)
                 
                 # Code-literate organisms are more creative
-                if hasattr(self.traits, 'creativity'):
-                    self.traits.creativity = min(1.0, self.traits.creativity + 0.05)
+                traits.creativity = min(1.0, traits.creativity + 0.05)
                 
                 # They also take more risks to find better data sources
-                if hasattr(self.traits, 'risk_taking'):
-                    self.traits.risk_taking = min(1.0, self.traits.risk_taking + 0.05)
+                traits.risk_taking = min(1.0, traits.risk_taking + 0.05)
                 
                 if self.age % 50 == 0 and self._behavior_modifiers['code_affinity'] > 0.3:
                     print(f"💻 Organism {self.id} recognizes code structures (familiarity: {self._behavior_modifiers['code_affinity']:.2f})")
@@ -1814,33 +1957,29 @@ class Organism:
                 if latest_emotion.sentiment == 'positive':
                     self._behavior_modifiers['emotional_state'] = 'optimistic'
                     # Optimistic organisms are more curious and explore more
-                    if hasattr(self.traits, 'curiosity'):
-                        self.traits.curiosity = min(1.0, self.traits.curiosity + 0.03)
+                    traits.curiosity = min(1.0, traits.curiosity + 0.03)
                 elif latest_emotion.sentiment == 'negative':
                     self._behavior_modifiers['emotional_state'] = 'cautious'
                     # Cautious organisms are more conservative and efficient
-                    if hasattr(self.traits, 'efficiency'):
-                        self.traits.efficiency = min(1.0, self.traits.efficiency + 0.03)
+                    traits.efficiency = min(1.0, traits.efficiency + 0.03)
             
             # BEHAVIOR 5: Knowledge specialization leads to emergent problem-solving
-            expertise_areas = knowledge_summary.get('expertise_areas', [])
             if len(expertise_areas) >= 2:
                 # Multi-domain experts become problem solvers
-                if not hasattr(self, '_problem_solver'):
+                if not self._problem_solver:
                     self._problem_solver = True
                     print(f"🔗 Organism {self.id} can connect different data types! Areas: {expertise_areas}")
                     try:
-                        from genesis.stream import doom_feed
-                        doom_feed.add('ability', f"{self.id} became a problem-solver", 2, {'organism': self.id})
+                        self._feed('ability', f"{self.id} became a problem-solver", 2, {'organism': self.id})
                     except Exception:
                         pass
                 
                 # Problem solvers help other organisms occasionally
-                if hasattr(self.traits, 'cooperation') and random.random() < 0.1:
-                    self.traits.cooperation = min(1.0, self.traits.cooperation + 0.02)
+                if random.random() < 0.1:
+                    traits.cooperation = min(1.0, traits.cooperation + 0.02)
             
             # BEHAVIOR 6: High knowledge organisms develop teaching tendencies
-            if knowledge_summary['total_insights'] >= 15 and not self.has_capability(Capability.TEACH):
+            if total_insights >= 15 and not self.has_capability(Capability.TEACH):
                 if random.random() < 0.3:  # 30% chance to develop teaching
                     print(f"📚 Organism {self.id} begins sharing what it has learned with others")
                     # This could trigger evolution toward TEACH capability
@@ -1850,35 +1989,25 @@ class Organism:
                         self.evolution_pressure['desired_capabilities'].append(Capability.TEACH)
 
         # BRAIN-INFLUENCED BEHAVIOR MODIFIERS
-        if getattr(self, '_brain_drives', None):
-            drives = self._brain_drives
-            # Initialize container if needed
-            if not hasattr(self, '_behavior_modifiers'):
-                self._behavior_modifiers = {}
+        drives = self._brain_drives
+        if drives:
+            risk = drives.get('risk', 0.0)
+            social = drives.get('social', 0.0)
             # Update soft biases from actuators
             self._behavior_modifiers['structure_bias'] = drives.get('prefer_structured', 0.0)
-            self._behavior_modifiers['risk_bias'] = drives.get('risk', 0.0)
-            self._behavior_modifiers['social_bias'] = drives.get('social', 0.0)
+            self._behavior_modifiers['risk_bias'] = risk
+            self._behavior_modifiers['social_bias'] = social
             # Nudge traits slightly based on drives
-            if hasattr(self.traits, 'risk_taking'):
-                self.traits.risk_taking = min(1.0, max(0.0, self.traits.risk_taking * (1.0 + (drives.get('risk', 0.0) - 0.5) * 0.05)))
-            if hasattr(self.traits, 'cooperation'):
-                self.traits.cooperation = min(1.0, max(0.0, self.traits.cooperation * (1.0 + (drives.get('social', 0.0) - 0.5) * 0.04)))
-            if hasattr(self.traits, 'efficiency'):
-                self.traits.efficiency = min(1.0, max(0.0, self.traits.efficiency * (1.0 + (drives.get('conserve', 0.0) - 0.5) * 0.03)))
-    
-    def communicate_with_other_organisms(self):
+            traits.risk_taking = min(1.0, max(0.0, traits.risk_taking * (1.0 + (risk - 0.5) * 0.05)))
+            traits.cooperation = min(1.0, max(0.0, traits.cooperation * (1.0 + (social - 0.5) * 0.04)))
+            traits.efficiency = min(1.0, max(0.0, traits.efficiency * (1.0 + (drives.get('conserve', 0.0) - 0.5) * 0.03)))
+    
+    def communicate_with_other_organisms(self, knowledge_summary: Optional[Dict] = None):
         """Simple communication system between organisms"""
         
-        # Prepare knowledge summary for chatter (allow communication even without insights)
-        knowledge_summary = (self.knowledge_base.get_knowledge_summary()
-                             if getattr(self, 'knowledge_base', None)
-                             else {'total_insights': 0})
-        
         # Brain-derived social drive influences communication likelihood
-        social_drive = 0.0
-        if getattr(self, '_brain_drives', None):
-            social_drive = self._brain_drives.get('social', 0.0)
+        drives = self._brain_drives
+        social_drive = drives.get('social', 0.0)
         
         # Simple signaling based on current state
         social_boost = 0.1 * social_drive
@@ -1886,8 +2015,7 @@ class Organism:
             # High energy organisms signal success
             print(f"📡 Organism {self.id} signals: Found abundant food source!")
             try:
-                from genesis.stream import doom_feed
-                doom_feed.add('signal', f"{self.id} boasts of abundance", 1, {'organism': self.id})
+                self._feed('signal', f"{self.id} boasts of abundance", 1, {'organism': self.id})
             except Exception:
                 pass
             
@@ -1895,118 +2023,109 @@ class Organism:
             # Low energy organisms signal distress
             print(f"🆘 Organism {self.id} signals: Need help finding food!")
             try:
-                from genesis.stream import doom_feed
-                doom_feed.add('distress', f"{self.id} calls for help", 3, {'organism': self.id})
+                self._feed('distress', f"{self.id} calls for help", 3, {'organism': self.id})
             except Exception:
                 pass
             
-        elif getattr(self, 'knowledge_base', None) and self.knowledge_base.knowledge_items:
+        elif self.knowledge_base and self.knowledge_base.knowledge_items:
             # Sometimes share that they learned something, without quoting raw input
             if random.random() < (0.05 + 0.1 * social_drive):  # stronger with social drive
                 print(f"💡 Organism {self.id} shares: understanding grows")
                 try:
-                    from genesis.stream import doom_feed
-                    doom_feed.add('share', f"{self.id} reflects on learning", 1, {'organism': self.id})
+                    self._feed('share', f"{self.id} reflects on learning", 1, {'organism': self.id})
                 except Exception:
                     pass
         
         # React to frustration by calling for help
-        if hasattr(self, 'frustration') and self.frustration > 0.8 and random.random() < 0.2:
+        if self.frustration > 0.8 and random.random() < 0.2:
             print(f"😤 Organism {self.id} signals frustration: Struggling to survive!")
             try:
-                from genesis.stream import doom_feed
-                doom_feed.add('frustration', f"{self.id} is frustrated", 2, {'organism': self.id})
+                self._feed('frustration', f"{self.id} is frustrated", 2, {'organism': self.id})
             except Exception:
                 pass
         # Occasional chatter: emit brain-driven talk only (no raw input snippets)
         if random.random() < 0.2:
             msg = '[silent contemplative humming]'
             top = None
-            if hasattr(self, 'last_digestion'):
+            if self.last_digestion:
                 top = self.last_digestion.get('top')
             if top:
                 msg = self._brain_talk_from_acts(top)
             try:
-                from genesis.stream import doom_feed
-                doom_feed.add('chatter', f"{self.id}: {msg}", 1, {'organism': self.id})
+                self._feed('chatter', f"{self.id}: {msg}", 1, {'organism': self.id})
             except Exception:
                 pass
 
         # Passive listening: sometimes respond to recent chatter from others
         try:
             if random.random() < 0.15:
-                from genesis.stream import doom_feed
                 recent = doom_feed.get_recent(20)
                 # Find last chatter not from self
                 other = None
+                own_prefix = f"{self.id}:"
                 for evt in reversed(recent):
                     if evt.get('tag') == 'chatter':
                         msg = evt.get('message', '')
-                        if not msg.startswith(f"{self.id}:"):
+                        if not msg.startswith(own_prefix):
                             other = msg
                             break
                 if other:
                     # Brain-shaped reply
-                    reply = self._brain_talk_from_acts(self.last_digestion.get('top')) if getattr(self, 'last_digestion', None) else 'ack'
-                    doom_feed.add('chatter', f"{self.id}: {reply}", 1, {'organism': self.id, 'reply_to': other})
+                    reply = self._brain_talk_from_acts(self.last_digestion.get('top')) if self.last_digestion else 'ack'
+                    self._feed('chatter', f"{self.id}: {reply}", 1, {'organism': self.id, 'reply_to': other})
         except Exception:
             pass
 
-        # Teaching inclination influenced by social drive and teach actuator
-        if getattr(self, 'knowledge_base', None):
-            summary = self.knowledge_base.get_knowledge_summary()
-            teach_drive = getattr(self, '_brain_drives', {}).get('teach', 0.0)
-            if summary['total_insights'] >= 10 and (social_drive > 0.7 or teach_drive > 0.6) and random.random() < 0.15:
+        # Teaching inclination influenced by social drive and teach actuator;
+        # the knowledge summary is only needed once the drive gate passes
+        if self.knowledge_base and (social_drive > 0.7 or drives.get('teach', 0.0) > 0.6):
+            if knowledge_summary is None:
+                knowledge_summary = self.knowledge_base.get_knowledge_summary()
+            if knowledge_summary['total_insights'] >= 10 and random.random() < 0.15:
                 self._attempt_teaching_action()
 
         # Trade inclination: share a recent high-yield lead on the trade board
-        trade_drive = getattr(self, '_brain_drives', {}).get('trade', 0.0)
+        trade_drive = drives.get('trade', 0.0)
         if trade_drive > 0.75 and random.random() < 0.12:
             # Share a good food memory as a lead
-            if hasattr(self, 'good_food_memories') and self.good_food_memories:
+            if self.good_food_memories:
                 best = max(self.good_food_memories[-5:], key=lambda m: m.get('energy_gained', 0.0))
                 try:
-                    from data_sources.harvesters import DataType
                     ft = best.get('food_type')
                     if isinstance(ft, DataType):
-                        trade_board.post_lead(self.id, ft, best.get('source', 'unknown'), best.get('energy_gained', 0.0), region=getattr(self, 'current_region', None))
+                        trade_board.post_lead(self.id, ft, best.get('source', 'unknown'), best.get('energy_gained', 0.0), region=self.current_region)
                     else:
                         # Fallback: just announce
-                        from genesis.stream import doom_feed
-                        doom_feed.add('trade_offer', f"{self.id} offers lead from {best.get('source','?')}", 1, {'organism': self.id})
+                        self._feed('trade_offer', f"{self.id} offers lead from {best.get('source','?')}", 1, {'organism': self.id})
                 except Exception:
                     pass
             else:
                 try:
-                    from genesis.stream import doom_feed
-                    doom_feed.add('trade_offer', f"{self.id} seeks leads", 1, {'organism': self.id})
+                    self._feed('trade_offer', f"{self.id} seeks leads", 1, {'organism': self.id})
                 except Exception:
                     pass
         # Migration inclination (placeholder)
-        migrate_drive = getattr(self, '_brain_drives', {}).get('migrate', 0.0)
+        migrate_drive = drives.get('migrate', 0.0)
         if migrate_drive > 0.85 and random.random() < 0.05:
             print(f"🚶 Organism {self.id} dreams of migrating to richer habitats")
             try:
-                from genesis.stream import doom_feed
-                doom_feed.add('migrate_intent', f"{self.id} dreams of migrating", 1, {'organism': self.id})
+                self._feed('migrate_intent', f"{self.id} dreams of migrating", 1, {'organism': self.id})
             except Exception:
                 pass
 
     def _attempt_teaching_action(self):
         print(f"👩‍🏫 Organism {self.id} offers to teach others")
         try:
-            from genesis.stream import doom_feed
-            doom_feed.add('teach_offer', f"{self.id} offers to teach", 2, {'organism': self.id})
+            self._feed('teach_offer', f"{self.id} offers to teach", 2, {'organism': self.id})
         except Exception:
             pass
         # Self-improvement from teaching attempt
-        if hasattr(self, 'organisms_taught'):
-            self.organisms_taught.add(self.id + f"_{self.age}")
+        self.organisms_taught.add(self.id + f"_{self.age}")
         if hasattr(self.traits, 'learning_rate'):
             self.traits.learning_rate *= 1.01
         # Share a structural preference hint via trade board to help others
         try:
-            drives = getattr(self, '_brain_drives', {}) or {}
+            drives = self._brain_drives
             hint = None
             if drives.get('prefer_structured', 0.0) > 0.6:
                 hint = 'prefer_structured'
@@ -2014,7 +2133,7 @@ class Organism:
                 hint = 'prefer_code'
             if hint:
                 # Post a hint-only lead (no specific type/source)
-                trade_board.post_lead(self.id, None, 'teaching', 0.0, hint=hint, region=getattr(self, 'current_region', None))
+                trade_board.post_lead(self.id, None, 'teaching', 0.0, hint=hint, region=self.current_region)
         except Exception:
             pass
     
@@ -2025,16 +2144,9 @@ class Organism:
             return
         
         # Analyze patterns to improve foraging
-        food_type_success = {}
+        food_type_success = defaultdict(float)
         for pattern in patterns:
-            food_type = pattern['food_type']
-            if food_type not in food_type_success:
-                food_type_success[food_type] = 0
-            food_type_success[food_type] += pattern['energy_gained']
-        
-        # Remember the best food types
-        if not hasattr(self, 'preferred_food_types'):
-            self.preferred_food_types = []
+            food_type_success[pattern['food_type']] += pattern['energy_gained']
         
         # Update preferences based on success
         best_food_type = max(food_type_success.items(), key=lambda x: x[1])[0]
@@ -2049,9 +2161,26 @@ class Organism:
         if hasattr(self.traits, 'learning_rate'):
             self.traits.learning_rate *= 1.01  # Tiny improvement
     
+    def _feed(self, tag, message, importance=1, meta=None):
+        """Record a doom feed event (batched by the feed while live() runs)"""
+        if doom_feed:
+            doom_feed.add(tag, message, importance, meta)
+
     def live(self, data_ecosystem=None, nutrition_system=None, parent_care_system=None):
-        """One moment of existence - with evolutionary foraging"""
-        
+        """One moment of existence - with evolutionary foraging.
+
+        Feed events added during the tick, including those the parent and the
+        trade board add on this organism's behalf, are published in one batch
+        in the order they happened as soon as the tick ends, so organisms
+        living after it in the same tick can hear them.
+        """
+        if not doom_feed:
+            self._live_tick(data_ecosystem, nutrition_system, parent_care_system)
+            return
+        with doom_feed.batched():
+            self._live_tick(data_ecosystem, nutrition_system, parent_care_system)
+
+    def _live_tick(self, data_ecosystem, nutrition_system, parent_care_system):
         self.age += 1
         
         # EVOLUTIONARY FORAGING: Let organisms explore and discover
@@ -2060,26 +2189,24 @@ class Organism:
         # SLOWER ENERGY DRAIN - gives more time for foraging
         base_drain = 0.6  # Slower baseline metabolism
         if data_ecosystem:
-            eco_stats = data_ecosystem.get_ecosystem_stats()
-            food_available = eco_stats.get('total_food_available', 0)
+            count_food = getattr(data_ecosystem, 'food_available_count', None)
+            if count_food is not None:
+                food_available = count_food()
+            else:
+                food_available = data_ecosystem.get_ecosystem_stats().get('total_food_available', 0)
             if food_available < 5:  # Severe scarcity
                 base_drain = 0.2  # Deep hibernation
             elif food_available < 15:  # Moderate scarcity  
                 base_drain = 0.4  # Conservation mode
         
         # Efficiency based on age and fitness
-        efficiency_factor = 1.0
-        if hasattr(self, 'energy_efficiency'):
-            efficiency_factor = max(0.3, self.energy_efficiency)
+        efficiency_factor = max(0.3, self.energy_efficiency)
         
         # Conserve drive can slightly reduce energy drain
-        conserve = 0.0
-        if getattr(self, '_brain_drives', None):
-            conserve = self._brain_drives.get('conserve', 0.0)
+        drives = self._brain_drives
+        conserve = drives.get('conserve', 0.0)
         # Exploration incurs a small activity cost; conservation reduces it
-        explore = 0.0
-        if getattr(self, '_brain_drives', None):
-            explore = self._brain_drives.get('explore', 0.0)
+        explore = drives.get('explore', 0.0)
         activity_multiplier = 1.0 + 0.1 * max(0.0, explore - 0.3)  # mild cost when explore is high
         actual_drain = (base_drain * (1.0 - 0.2 * conserve) * activity_multiplier) / efficiency_factor
         self.energy -= actual_drain
@@ -2097,11 +2224,16 @@ class Organism:
         # Check if organism should learn new capabilities from frustration
         self.check_frustration_based_learning()
         
+        # Summarize knowledge once per tick and share it across behaviors
+        knowledge_summary = (self.knowledge_base.get_knowledge_summary()
+                             if self.knowledge_base
+                             else None)
+        
         # EMERGENT BEHAVIORS: Act based on real knowledge accumulated
-        self.exhibit_knowledge_based_behaviors()
+        self.exhibit_knowledge_based_behaviors(knowledge_summary)
         
         # ORGANISM COMMUNICATION: Share signals with nearby organisms
-        self.communicate_with_other_organisms()
+        self.communicate_with_other_organisms(knowledge_summary)
         
         # Ask parent for help if capable and struggling
         if self.has_capability(Capability.ASK_PARENT) and self.energy < 40:
@@ -2116,7 +2248,8 @@ class Organism:
             self.attempt_evolution()
         # Decay any short-lived imitation pressure
         self._decay_social_bias()
-        # Task 9: gated self-introspection and tiny param self-tuning
+        # Task 9: gated self-introspection and tiny param self-tuning; each
+        # gate draws independently, so both can fire in the same tick
         try:
             if Capability.READ_SELF in self.capabilities and random.random() < 0.02:
                 self._maybe_self_introspect()
@@ -2129,18 +2262,13 @@ class Organism:
     def can_process(self, environment):
         """Check if organism has capabilities for this situation"""
         
-        if environment['type'] == 'real_food':
+        env_type = environment['type']
+        if env_type == 'real_food':
             # Check if organism can digest this type of real food
             morsel = environment['morsel']
             return morsel.is_consumable_by_capabilities(self.capabilities)
-        elif environment['type'] == 'complex_data':
-            return Capability.ABSTRACT in self.capabilities
-        elif environment['type'] == 'social_signal':
-            return Capability.RECEIVE in self.capabilities
-        elif environment['type'] == 'danger':
-            return Capability.PREDICT in self.capabilities
-        else:
-            return True
+        required = _SITUATION_CAPABILITY.get(env_type)
+        return required is None or required in self.capabilities
     
     def ask_for_help(self, environment):
         """Child asks parent for help"""
@@ -2155,7 +2283,7 @@ class Organism:
             # Advanced - can explain problem clearly
             request = {
                 'problem': environment,
-                'attempted_solutions': self.memory[-5:],
+                'attempted_solutions': self.recent_memories(5),
                 'hypothesis': self.generate_hypothesis(environment)
             }
         elif Capability.SIGNAL in self.capabilities:
@@ -2202,8 +2330,7 @@ class Organism:
                 self.capabilities.add(new_capability)
                 print(f"Organism {self.id} unlocked {new_capability.value}!")
                 try:
-                    from genesis.stream import doom_feed
-                    doom_feed.add('unlock', f"{self.id} unlocked {new_capability.value}", 3,
+                    self._feed('unlock', f"{self.id} unlocked {new_capability.value}", 3,
                                   {'organism': self.id, 'capability': new_capability.value})
                 except Exception:
                     pass
@@ -2219,150 +2346,117 @@ class Organism:
         """
         if not self.brain_genome or not self.brain:
             return
-        from genesis.brain import DEFAULT_SENSORS, DEFAULT_ACTUATORS
 
         genome = self.brain_genome.data
+        # Snapshot of last sensed signals if available
+        sensor_snapshot = self._last_sensor_map
+        kb = self.knowledge_base
+        has_knowledge = kb is not None and kb.insights_generated >= 5
+        # Only the count is needed; the full summary also evaluates the clock
+        total_insights = kb.insight_count() if kb is not None else 0
+        lead_successes = getattr(self, 'trade_lead_successes', 0) + getattr(self, 'hint_lead_successes', 0)
+        # Nothing sensed yet (e.g. right after birth) means every candidate is absent
+        absent = (tuple(s for s in _PRUNE_CANDIDATES if _signal_absent(sensor_snapshot.get(s, None)))
+                  if sensor_snapshot else _PRUNE_CANDIDATES)
+
+        # Every decision below is a function of these inputs; if they match the
+        # last call that left the genome untouched, this call is a no-op too
+        trigger_key = (
+            id(self.brain_genome),
+            tuple(genome.get('sensors', DEFAULT_SENSORS)),
+            tuple(genome.get('actuators', DEFAULT_ACTUATORS)),
+            has_knowledge, total_insights >= 10, lead_successes >= 2, absent,
+            float(sensor_snapshot.get('toxicity_buildup', 0.0)) > 0.4,
+            'metabolic_efficiency' in sensor_snapshot,
+            float(sensor_snapshot.get('recent_success', 0.5)) < 0.35,
+            float(sensor_snapshot.get('competition_local', 0.0)) > 0.7,
+        )
+        if trigger_key == self._adapt_trigger_key:
+            return
+
         sensors = list(genome.get('sensors', list(DEFAULT_SENSORS)))
         actuators = list(genome.get('actuators', list(DEFAULT_ACTUATORS)))
+        # Set mirrors for membership tests; kept in sync with every append/remove
+        sensors_set = set(sensors)
+        actuators_set = set(actuators)
 
         changed = False
 
-        # Snapshot of last sensed signals if available
-        sensor_snapshot = getattr(self, '_last_sensor_map', {}) or {}
-
         # Prefer including structure/availability and freshness when organism has knowledge
-        has_knowledge = (getattr(self, 'knowledge_base', None) is not None and
-                         getattr(self.knowledge_base, 'insights_generated', 0) >= 5)
         for useful in ('availability_structured', 'freshness_expectation'):
-            if has_knowledge and useful not in sensors and useful in DEFAULT_SENSORS:
-                sensors.append(useful)
+            if has_knowledge and useful not in sensors_set and useful in DEFAULT_SENSORS_SET:
+                sensors.append(useful); sensors_set.add(useful)
                 changed = True
 
         # Add metabolic sensors if signals suggest they matter
-        if float(sensor_snapshot.get('toxicity_buildup', 0.0)) > 0.4 and 'toxicity_buildup' not in sensors:
-            sensors.append('toxicity_buildup'); changed = True
-        if 'metabolic_efficiency' in sensor_snapshot and 'metabolic_efficiency' not in sensors:
-            sensors.append('metabolic_efficiency'); changed = True
+        if float(sensor_snapshot.get('toxicity_buildup', 0.0)) > 0.4 and 'toxicity_buildup' not in sensors_set:
+            sensors.append('toxicity_buildup'); sensors_set.add('toxicity_buildup'); changed = True
+        if 'metabolic_efficiency' in sensor_snapshot and 'metabolic_efficiency' not in sensors_set:
+            sensors.append('metabolic_efficiency'); sensors_set.add('metabolic_efficiency'); changed = True
 
         # If recent success is low, include novelty hunger to encourage exploration
-        if float(sensor_snapshot.get('recent_success', 0.5)) < 0.35 and 'novelty_hunger' not in sensors:
-            sensors.append('novelty_hunger'); changed = True
+        if float(sensor_snapshot.get('recent_success', 0.5)) < 0.35 and 'novelty_hunger' not in sensors_set:
+            sensors.append('novelty_hunger'); sensors_set.add('novelty_hunger'); changed = True
 
         # Prune sensors that are unavailable and likely noise for us
-        maybe_prune = []
-        for s in ('availability_code', 'availability_structured', 'freshness_expectation', 'toxicity_buildup'):
-            val = sensor_snapshot.get(s, None)
-            if s in sensors and (val is None or (isinstance(val, (int, float)) and val == 0.0)):
-                maybe_prune.append(s)
+        maybe_prune = [s for s in absent if s in sensors_set]
         # Keep at least a core set; prune at most one per adaptation
-        CORE = {'energy', 'frustration', 'memory_load', 'scarcity', 'age', 'capability_density'}
-        prunable = [s for s in maybe_prune if s not in CORE]
-        if prunable and random.random() < 0.5 and len(sensors) > len(CORE) + 2:
+        prunable = [s for s in maybe_prune if s not in _CORE_SENSORS]
+        if prunable and random.random() < 0.5 and len(sensors) > len(_CORE_SENSORS) + 2:
             to_remove = prunable[0]
-            sensors.remove(to_remove)
+            sensors.remove(to_remove); sensors_set.discard(to_remove)
             changed = True
 
         # Actuators: add teach/trade when behavior/experience supports it
-        total_insights = 0
-        try:
-            if getattr(self, 'knowledge_base', None):
-                total_insights = self.knowledge_base.get_knowledge_summary().get('total_insights', 0)
-        except Exception:
-            pass
-        if total_insights >= 10 and 'teach' not in actuators and 'teach' in DEFAULT_ACTUATORS:
-            actuators.append('teach'); changed = True
+        if total_insights >= 10 and 'teach' not in actuators_set and 'teach' in DEFAULT_ACTUATORS_SET:
+            actuators.append('teach'); actuators_set.add('teach'); changed = True
         # If we validated trade/teaching leads, ensure 'trade' actuator present
-        if (getattr(self, 'trade_lead_successes', 0) + getattr(self, 'hint_lead_successes', 0)) >= 2 and 'trade' not in actuators:
-            actuators.append('trade'); changed = True
+        if lead_successes >= 2 and 'trade' not in actuators_set:
+            actuators.append('trade'); actuators_set.add('trade'); changed = True
 
         # If competition/scarcity high and migrate not present, consider adding it
-        if float(sensor_snapshot.get('competition_local', 0.0)) > 0.7 and 'migrate' not in actuators:
-            actuators.append('migrate'); changed = True
+        if float(sensor_snapshot.get('competition_local', 0.0)) > 0.7 and 'migrate' not in actuators_set:
+            actuators.append('migrate'); actuators_set.add('migrate'); changed = True
 
         # Guardrails: avoid unbounded growth (bloat)
-        MAX_SENSORS = 16
-        MAX_ACTUATORS = 12
-        if len(sensors) > MAX_SENSORS:
-            # prune extras preferring to keep CORE first
-            CORE = {'energy', 'frustration', 'memory_load', 'scarcity', 'age', 'capability_density'}
-            extras = [s for s in sensors if s not in CORE]
-            while len(sensors) > MAX_SENSORS and extras:
+        if len(sensors) > _MAX_SENSORS:
+            # prune extras preferring to keep core sensors first
+            extras = [s for s in sensors if s not in _CORE_SENSORS]
+            while len(sensors) > _MAX_SENSORS and extras:
                 sensors.remove(extras.pop(0))
             changed = True
-        if len(actuators) > MAX_ACTUATORS:
-            extras_a = [a for a in actuators if a not in ('explore','conserve','social')]
-            while len(actuators) > MAX_ACTUATORS and extras_a:
+        if len(actuators) > _MAX_ACTUATORS:
+            extras_a = [a for a in actuators if a not in _CORE_ACTUATORS]
+            while len(actuators) > _MAX_ACTUATORS and extras_a:
                 actuators.remove(extras_a.pop(0))
             changed = True
 
+        # Calls that could still prune on a later coin flip are never memoised
+        self._adapt_trigger_key = None if (changed or prunable) else trigger_key
+
         if changed:
-            # Apply to genome and resize matrices
-            old_in = genome.get('topology', {}).get('in', len(self.brain.sensors))
-            old_out = genome.get('topology', {}).get('out', len(self.brain.actuators))
+            # Apply to genome and resize matrices in place on the live brain
             genome['sensors'] = sensors
             genome['actuators'] = actuators
             new_in = len(sensors)
             new_out = len(actuators)
-            if new_in != old_in:
-                # Safe resize inputs
-                try:
-                    self.brain_genome._resize_inputs(new_in)
-                    genome['topology']['in'] = new_in
-                except Exception:
-                    pass
-            if new_out != old_out:
-                try:
-                    self.brain_genome._resize_outputs(new_out)
-                    genome['topology']['out'] = new_out
-                except Exception:
-                    pass
-            # Rebuild brain phenotype
             try:
-                from genesis.brain import Brain
-                self.brain = Brain(self.brain_genome)
+                self.brain.reshape(new_in, new_out)
             except Exception:
                 pass
             # Surface event
             try:
-                from genesis.stream import doom_feed
-                doom_feed.add('interfaces', f"{self.id} adapted brain I/O (in={new_in}, out={new_out})", 1,
+                self._feed('interfaces', f"{self.id} adapted brain I/O (in={new_in}, out={new_out})", 1,
                               {'organism': self.id})
             except Exception:
                 pass
     
     def check_unlock_conditions(self) -> List[Capability]:
         """What capabilities can potentially be unlocked?"""
-        
-        unlockable = []
-        
-        # Basic unlocks
-        if Capability.EAT_TEXT in self.capabilities:
-            if self.memory_usage() > 50:
-                unlockable.append(Capability.REMEMBER)
-            if self.age > 100:
-                unlockable.append(Capability.PATTERN_MATCH)
-        
-        # Communication unlocks
-        if Capability.PATTERN_MATCH in self.capabilities:
-            if self.social_interactions > 10:
-                unlockable.append(Capability.SIGNAL)
-            # ASK_PARENT is now unlocked through frustration-based learning only!
-        
-        # Advanced unlocks
-        if Capability.REMEMBER in self.capabilities and Capability.PATTERN_MATCH in self.capabilities:
-            if self.successful_predictions > 5:
-                unlockable.append(Capability.PREDICT)
-            if self.traits.creativity > 0.5:
-                unlockable.append(Capability.CREATE)
-        
-        # Code manipulation unlocks (very rare)
-        if Capability.ABSTRACT in self.capabilities and Capability.CREATE in self.capabilities:
-            if self.introspection_attempts > 20:
-                unlockable.append(Capability.READ_SELF)
-            if Capability.READ_SELF in self.capabilities:
-                unlockable.append(Capability.MODIFY_PARAM)
-        
-        return unlockable
+        caps = self.capabilities
+        # Subset test first so the (possibly costly) predicate only runs when eligible
+        return [unlock for required, predicate, unlock in _UNLOCK_RULES
+                if required <= caps and predicate(self)]
     
     def try_unlock(self, capability: Capability) -> bool:
         """Attempt to unlock a capability"""
@@ -2390,22 +2484,39 @@ class Organism:
         
         return energy_ready and age_ready and capability_ready
     
-    def find_mate(self, population) -> Optional['Organism']:
-        """Find suitable mate from population"""
-        potential_mates = [
-            org for org in population 
-            if (org != self and 
-                org.can_reproduce() and 
-                org.generation <= self.generation + 2 and  # Not too different generations
-                org.generation >= self.generation - 2)
-        ]
-        
-        if not potential_mates:
-            return None
-        
-        # Choose mate with highest fitness (fitness-based selection)
-        best_mate = max(potential_mates, key=lambda org: getattr(org, 'current_fitness', 0.5))
-        return best_mate
+    @staticmethod
+    def build_mate_index(population) -> Dict[int, List[tuple]]:
+        """
+        Bucket reproduction-ready organisms by generation, each bucket ordered
+        by fitness (best first, population order on ties). Built once per tick;
+        refreshes every organism's readiness snapshot read by find_mate.
+        """
+        index = defaultdict(list)
+        for pos, org in enumerate(population):
+            org._can_reproduce_cached = ready = org.can_reproduce()
+            if ready:
+                index[org.generation].append((-org.current_fitness, pos, org))
+        for bucket in index.values():
+            bucket.sort(key=itemgetter(0, 1))
+        return index
+
+    def find_mate(self, population, mate_index=None) -> Optional['Organism']:
+        """Find suitable mate from population (uses the per-tick readiness snapshot)"""
+        if mate_index is None:
+            mate_index = self.build_mate_index(population)
+        best = None
+        # Not too different generations: scan only the +/-2 buckets
+        for gen in range(self.generation - 2, self.generation + 3):
+            for entry in mate_index.get(gen, ()):
+                org = entry[2]
+                # Parents that already reproduced this tick have cleared their flag
+                if org is self or not org._can_reproduce_cached:
+                    continue
+                # Choose mate with highest fitness (fitness-based selection)
+                if best is None or entry[:2] < best[:2]:
+                    best = entry
+                break
+        return best[2] if best is not None else None
     
     def reproduce(self, mate=None, fitness_culture_system=None, behavior_version=None):
         """Create offspring with mate using proper inheritance"""
@@ -2423,6 +2534,9 @@ class Organism:
         
         self.energy -= reproduction_cost
         mate.energy -= reproduction_cost
+        # Paid parents drop out of this tick's mate pool
+        self._can_reproduce_cached = False
+        mate._can_reproduce_cached = False
         
         # Create offspring using inheritance system
         if fitness_culture_system:
@@ -2439,10 +2553,10 @@ class Organism:
             }
         
         # Create child
-        child = Organism(offspring_genome['generation'], offspring_genome)
+        child = Organism(offspring_genome['generation'], offspring_genome,
+                         parent_connection=self.parent_connection)
         # Inherit brain via recombination when possible (Task 8.1)
         try:
-            from genesis.brain import BrainGenome, Brain
             pg_a = getattr(self, 'brain_genome', None)
             pg_b = getattr(mate, 'brain_genome', None)
             if pg_a is not None and pg_b is not None:
@@ -2452,9 +2566,8 @@ class Organism:
                     child.brain_genome = recombined
                     child.brain = Brain(recombined)
                     try:
-                        from genesis.stream import doom_feed
                         topo = recombined.data.get('topology', {})
-                        doom_feed.add('recombine_brain',
+                        self._feed('recombine_brain',
                                       f"{child.id} brain I/H/O=({topo.get('in')},{topo.get('hid')},{topo.get('out')})",
                                       1,
                                       {'parent_a': self.id, 'parent_b': mate.id, 'organism': child.id})
@@ -2462,7 +2575,7 @@ class Organism:
                         pass
                 except Exception:
                     # Fallback to one-parent clone + mutate
-                    parent_src = self if getattr(self, 'current_fitness', 0.0) >= getattr(mate, 'current_fitness', 0.0) else mate
+                    parent_src = self if self.current_fitness >= mate.current_fitness else mate
                     pg = getattr(parent_src, 'brain_genome', None)
                     if pg and hasattr(pg, 'to_dict'):
                         cloned = BrainGenome.from_dict(pg.to_dict())
@@ -2481,7 +2594,7 @@ class Organism:
             pass
         # Inherit and mutate body parts (limbs)
         try:
-            parent_src = self if getattr(self, 'current_fitness', 0.0) >= getattr(mate, 'current_fitness', 0.0) else mate
+            parent_src = self if self.current_fitness >= mate.current_fitness else mate
             pg = getattr(parent_src, 'body_genome', None)
             if pg and hasattr(pg, 'to_dict'):
                 from genesis.body_parts import BodyPartGenome, Body
@@ -2528,7 +2641,7 @@ class Organism:
         """
         try:
             from genesis.self_modify import SelfModifyManager
-            sm = getattr(self, '_self_modify_manager', None)
+            sm = self._self_modify_manager
             if sm is None:
                 sm = SelfModifyManager()
                 self._self_modify_manager = sm
@@ -2537,8 +2650,7 @@ class Organism:
             return bv
         except Exception as e:
             try:
-                from genesis.stream import doom_feed
-                doom_feed.add('shadow_patch_failed', f"{self.id}: {e}", 2, {'organism': self.id})
+                self._feed('shadow_patch_failed', f"{self.id}: {e}", 2, {'organism': self.id})
             except Exception:
                 pass
             return None
@@ -2559,9 +2671,8 @@ class Organism:
             }
             # If a behavior version is bound, mark child as in a trial unconditionally
             child.in_trial = True
-            from genesis.stream import doom_feed
             mv = child._behavior_version
-            doom_feed.add('behavior_version', f"{child.id} bound {mv['shadow_module'].split('.')[-1]}", 1, {'organism': child.id})
+            self._feed('behavior_version', f"{child.id} bound {mv['shadow_module'].split('.')[-1]}", 1, {'organism': child.id})
         except Exception:
             pass
 
@@ -2582,8 +2693,7 @@ class Organism:
         try:
             sm.snapshot_module_source('genesis.evolution')
             self.introspection_attempts += 1
-            from genesis.stream import doom_feed
-            doom_feed.add('introspect', f"{self.id} read own code", 1, {'organism': self.id})
+            self._feed('introspect', f"{self.id} read own code", 1, {'organism': self.id})
         except Exception:
             # Keep silent; introspection is best-effort
             pass
@@ -2640,6 +2750,48 @@ class Organism:
         return None
 
 # Example of organism ecosystem runtime
+
+
+def _energy_crisis_fraction(organisms) -> float:
+    """Fraction of organisms below the crisis energy line (30)."""
+    if not organisms:
+        return 0.0
+    return sum(o.energy < 30 for o in organisms) / len(organisms)
+
+
+def _remove_dead(organisms: List['Organism']) -> int:
+    """Drop organisms out of energy, in place; returns the number removed.
+
+    Deaths are rare, so the list is only rebuilt when one actually occurred.
+    """
+    initial_count = len(organisms)
+    if any(o.energy <= 0 for o in organisms):
+        organisms[:] = [o for o in organisms if o.energy > 0]
+    return initial_count - len(organisms)
+
+
+def _organism_status_line(number: int, organism: 'Organism') -> str:
+    """One line of the periodic ecosystem status report."""
+    emotional_state = organism.get_emotional_state()
+    can_ask_for_help = "🙋" if Capability.ASK_PARENT in organism.capabilities else "🤐"
+    can_reproduce_symbol = "💕" if organism.can_reproduce() else "⭕"
+    fitness = organism.current_fitness
+
+    # Show organism knowledge
+    knowledge_info = ""
+    kb = organism.knowledge_base
+    if kb is not None:
+        summary = kb.get_knowledge_summary()
+        if summary['total_insights'] > 0:
+            knowledge_info = f", Insights={summary['total_insights']}"
+            if summary['expertise_areas']:
+                knowledge_info += f", Expertise={summary['expertise_areas'][0]}"
+
+    return (f"  🦠 Organism {number} (gen {organism.generation}): Energy={organism.energy:.1f}, "
+            f"Caps={len(organism.capabilities)}, Age={organism.age}, "
+            f"Fitness={fitness:.2f}, State={emotional_state} {can_ask_for_help}{can_reproduce_symbol}{knowledge_info}")
+
+
 if __name__ == "__main__":
     # When executed as a script (python genesis/evolution.py), this module name
     # is __main__. Some components import Capability from 'genesis.evolution'.
@@ -2653,7 +2805,6 @@ if __name__ == "__main__":
         print("🌱 Starting SimpleEnvironment (local grid substrate)...")
         try:
             from genesis.environment import SimpleEnvironment
-            from genesis.stream import doom_feed
             import random as _rand
             import time as _time
 
@@ -2678,6 +2829,10 @@ if __name__ == "__main__":
                 env.add_organism(x, y, energy=energy, M=M, epsilon=eps, honesty=h)
 
             tick = 0
+            # 10 steps per second for watching; ZOO_HEADLESS=1 runs unthrottled
+            headless = _os.getenv('ZOO_HEADLESS', '0') == '1'
+            frame_budget = 0.1
+            next_frame = _time.monotonic()
             print("🔄 Running simple-rule environment (Ctrl+C to stop)...")
             while True:
                 tick += 1
@@ -2690,7 +2845,15 @@ if __name__ == "__main__":
                     alive = len(env.organisms)
                     avgE = sum(o.energy for o in env.organisms) / max(1, alive)
                     doom_feed.add('summary', f"Tick {tick}: {alive} alive, avgE={avgE:.2f}", 1)
-                _time.sleep(0.1)
+                if not headless:
+                    # Sleep only what is left of the frame after the step
+                    next_frame += frame_budget
+                    delay = next_frame - _time.monotonic()
+                    if delay > 0:
+                        _time.sleep(delay)
+                    else:
+                        # Slow step: resync instead of bursting to catch up
+                        next_frame = _time.monotonic()
         except KeyboardInterrupt:
             print("\n🛑 Stopped simple-rule environment.")
             raise SystemExit(0)
@@ -2726,8 +2889,9 @@ if __name__ == "__main__":
 
         runtime = RuntimeManager()
 
-        # Seed a small population
-        organisms = [Organism(generation=0) for _ in range(3)]
+        # Seed a small population sharing one parent
+        parent_system = ParentHelp()
+        organisms = [Organism(generation=0, parent_connection=parent_system) for _ in range(3)]
         # Give a small nudge at boot: remembering helps initial foraging
         for o in organisms:
             try:
@@ -2776,7 +2940,6 @@ if __name__ == "__main__":
                 runtime.avg_brain_size = (sum(sizes) / len(sizes)) if sizes else 0.0
                 # Collect recent chatter from doom_feed
                 try:
-                    from genesis.stream import doom_feed
                     events = doom_feed.events  # direct access is fine here
                     start = int(getattr(runtime, '_last_feed_index', 0))
                     if start < 0 or start > len(events):
@@ -2881,7 +3044,8 @@ if __name__ == "__main__":
         # Enable LLM-powered advice for organisms (allow human-like teaching signals)
         parent_care_system = enhance_parent_care_with_llm(parent_care_system, llm_teacher)
         
-        # Create parent help system with economy (for advanced help)
+        # Parent help system with economy (for advanced help); the same
+        # parent the organisms ask, so the batch pass serves their requests
         parent_system = ParentHelp()
         
         # Check if we should continue from saved state
@@ -2889,11 +3053,13 @@ if __name__ == "__main__":
         if latest_save:
             print(f"📂 Found saved state - loading generation {latest_save['generation']}")
             organisms = persistence_system.load_generation(latest_save['file_path'])
+            for organism in organisms:
+                organism.parent_connection = parent_system
             current_generation = latest_save['generation']
             print(f"🔄 Resumed with {len(organisms)} organisms from generation {current_generation}")
         else:
             # Birth multiple organisms
-            organisms = [Organism(generation=0) for _ in range(3)]
+            organisms = [Organism(generation=0, parent_connection=parent_system) for _ in range(3)]
             print(f"🐣 Born {len(organisms)} organisms")
         
         # Live and evolve with real data and enhanced nutrition
@@ -2903,6 +3069,13 @@ if __name__ == "__main__":
         tick = 0
         print("🔄 Starting indefinite evolution loop...")
         
+        # Single worker for retention pruning, which only touches saved files
+        # and never the live organisms
+        io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='zoo-io')
+        
+        # Wall-clock deadline of the next tick; pacing subtracts compute time
+        next_tick = time.monotonic()
+        tick_overruns = 0  # ticks whose compute exceeded the 1s budget
         while True:  # INDEFINITE RUNTIME - run forever until manually stopped
             tick += 1
             # Auto-save state periodically
@@ -2914,24 +3087,27 @@ if __name__ == "__main__":
             nutrition_system['scarcity_manager'].update_scarcity(eco_stats, len(organisms))
             
             # CRISIS DETECTION AND RESPONSE
-            population_crisis_level = sum(1 for org in organisms if org.energy < 30) / len(organisms)
+            population_crisis_level = _energy_crisis_fraction(organisms)
             
             # Improved food crisis detection - consider both availability and organism population
-            total_food = eco_stats.get('total_food_available', 0)
-            organisms_count = len(organisms)
-            food_per_organism = total_food / max(organisms_count, 1)
+            total_food = eco_stats['total_food_available']
+            organisms_count = max(len(organisms), 1)
             
             # Crisis if less than 2 food items per organism AND low total food
-            food_crisis = (food_per_organism < 2.0 and total_food < 10) or total_food < 1
-            
-            # Only print crisis messages occasionally to reduce spam
-            if (population_crisis_level > 0.7 or food_crisis) and tick % 50 == 0:
-                print(f"🚨 ECOSYSTEM CRISIS: Population crisis {population_crisis_level:.2f}, Food crisis: {food_crisis}")
-                print(f"   Food stats: {total_food} total, {food_per_organism:.1f} per organism")
+            # (compared as total < 2 * count, so no per-tick division)
+            food_crisis = total_food < 1 or (total_food < 10 and total_food < 2.0 * organisms_count)
             
-            if population_crisis_level > 0.7 or food_crisis:
-                # Emergency parent budget boost
-                parent_care_system.emergency_budget_boost(population_crisis_level)
+            in_crisis = population_crisis_level > 0.7 or food_crisis
+            if in_crisis:
+                # Only print crisis messages occasionally to reduce spam
+                if tick % 50 == 0:
+                    print(f"🚨 ECOSYSTEM CRISIS: Population crisis {population_crisis_level:.2f}, Food crisis: {food_crisis}\n"
+                          f"   Food stats: {total_food} total, {total_food / organisms_count:.1f} per organism")
+                
+                # Emergency parent budget boost, throttled: the boost compounds
+                # on the current budget, so boosting every tick overshoots
+                if tick % 5 == 0:
+                    parent_care_system.emergency_budget_boost(population_crisis_level)
                 
                 # Reset parent energy during crisis
                 if day % 10 == 0:  # More frequent resets during crisis
@@ -2941,79 +3117,78 @@ if __name__ == "__main__":
             for organism in organisms:
                 organism.live(data_ecosystem, nutrition_system, parent_care_system)
                 
-                # Calculate fitness and apply cultural evolution
-                eco_stats = data_ecosystem.get_ecosystem_stats()
+                # Calculate fitness and apply cultural evolution against the
+                # tick's ecosystem snapshot taken above
                 apply_fitness_culture(organism, eco_stats, fitness_culture_system)
             
-            # Check for reproduction opportunities
-            reproduction_candidates = [org for org in organisms if org.can_reproduce()]
+            # Check for reproduction opportunities; only the first two ready
+            # organisms are tried, so stop scanning once they are found
+            reproduction_candidates = list(islice(filter(Organism.can_reproduce, organisms), 2))
             if len(reproduction_candidates) >= 2:
+                mate_index = None
                 # Try to reproduce some organisms
                 for organism in reproduction_candidates[:2]:  # Limit reproductions
-                    mate = organism.find_mate(organisms)
-                    if mate and random.random() < 0.1:  # 10% chance per tick
+                    # 10% chance per tick; drawn first so most ticks skip the mate search
+                    if random.random() >= 0.1:
+                        continue
+                    if mate_index is None:
+                        mate_index = Organism.build_mate_index(organisms)
+                    mate = organism.find_mate(organisms, mate_index)
+                    if mate:
                         child = organism.reproduce(mate, fitness_culture_system)
                         if child:
                             organisms.append(child)
             
             # Process batched help requests
-            if day % 10 == 0:
-                result = parent_system.process_batch_requests()
-                if result and result['helped'] > 0:
-                    print(f"🆘 Help Summary: {result['helped']} helped, {result['cached']} cached")
+            result = parent_system.process_batch_if_due(day)
+            if result and result['helped'] > 0:
+                print(f"🆘 Help Summary: {result['helped']} helped, {result['cached']} cached")
             
             # Show ecosystem status
             if day % 50 == 0:
-                print(f"\n=== Day {day}: Ecosystem Status ===")
+                # The whole report is collected and written as one block
+                report = [f"\n=== Day {day}: Ecosystem Status ==="]
                 
                 # Organism status
-                for i, organism in enumerate(organisms):
-                    emotional_state = organism.get_emotional_state()
-                    can_ask_for_help = "🙋" if organism.has_capability(Capability.ASK_PARENT) else "🤐"
-                    can_reproduce_symbol = "💕" if organism.can_reproduce() else "⭕"
-                    fitness = getattr(organism, 'current_fitness', 0.0)
-                    
-                    # Show organism knowledge
-                    knowledge_info = ""
-                    if hasattr(organism, 'knowledge_base') and organism.knowledge_base:
-                        summary = organism.knowledge_base.get_knowledge_summary()
-                        if summary['total_insights'] > 0:
-                            knowledge_info = f", Insights={summary['total_insights']}"
-                            if summary['expertise_areas']:
-                                knowledge_info += f", Expertise={summary['expertise_areas'][0]}"
-                    
-                    print(f"  🦠 Organism {i+1} (gen {organism.generation}): Energy={organism.energy:.1f}, "
-                          f"Caps={len(organism.capabilities)}, Age={organism.age}, "
-                          f"Fitness={fitness:.2f}, State={emotional_state} {can_ask_for_help}{can_reproduce_symbol}{knowledge_info}")
+                for i, organism in enumerate(organisms, 1):
+                    report.append(_organism_status_line(i, organism))
                 
                 # Data ecosystem status
                 eco_stats = data_ecosystem.get_ecosystem_stats()
                 scarcity_report = nutrition_system['scarcity_manager'].get_scarcity_report()
                 parent_report = parent_care_system.get_parenting_report()
                 
-                print(f"  🌍 Ecosystem: {eco_stats['total_food_available']} food available")
-                print(f"  🍯 Food types: {eco_stats['food_by_type']}")
-                print(f"  📉 Scarcity: {scarcity_report['scarcity_level']} "
-                      f"(global: {scarcity_report['global_scarcity']:.2f})")
-                print(f"  👨‍👩‍👧‍👦 Parent: {parent_report['feeding_budget_used']} feeding, "
-                      f"{parent_report['interventions_used']} interventions, "
-                      f"success: {parent_report['successful_children']}")
+                report.append(f"  🌍 Ecosystem: {eco_stats['total_food_available']} food available")
+                report.append(f"  🍯 Food types: {eco_stats['food_by_type']}")
+                report.append(f"  📉 Scarcity: {scarcity_report['scarcity_level']} "
+                              f"(global: {scarcity_report['global_scarcity']:.2f})")
+                report.append(f"  👨‍👩‍👧‍👦 Parent: {parent_report['feeding_budget_used']} feeding, "
+                              f"{parent_report['interventions_used']} interventions, "
+                              f"success: {parent_report['successful_children']}")
+                report.append(f"  ⏱️ Tick overruns: {tick_overruns}/{tick}")
+                print("\n".join(report))
             
             # Remove dead organisms and evolve population
-            initial_count = len(organisms)
-            organisms = [org for org in organisms if org.energy > 0]
-            deaths = initial_count - len(organisms)
+            deaths = _remove_dead(organisms)
             
             if deaths > 0:
                 print(f"💀 {deaths} organisms died")
                 
-            # Add new organisms to maintain population
-            while len(organisms) < 3:
-                new_gen = max(o.generation for o in organisms) + 1 if organisms else 1
-                organisms.append(Organism(generation=new_gen))
-                print(f"🐣 New organism born (generation {new_gen})")
+            # Add new organisms to maintain population; each newcomer is one
+            # generation past the newest generation alive, earlier newcomers included
+            needed = 3 - len(organisms)
+            if needed > 0:
+                base_gen = max((o.generation for o in organisms), default=0) + 1
+                organisms.extend(Organism(generation=base_gen + i,
+                                          parent_connection=parent_system)
+                                 for i in range(needed))
+                new_gen = base_gen + needed - 1
+                if needed == 1:
+                    print(f"🐣 New organism born (generation {new_gen})")
+                else:
+                    print(f"🐣 {needed} new organisms born (generations {base_gen}-{new_gen})")
                 
-                # Update current generation tracking
+                # Update current generation tracking once per refill
                 current_generation = max(current_generation, new_gen)
             
             # Auto-save organisms every 50 days
@@ -3022,15 +3197,23 @@ if __name__ == "__main__":
             
             day += 1  # Increment day counter
             # SLOWER SIMULATION: Give organisms time to forage and discover
-            time.sleep(1.0)  # 1 second per tick - allows proper foraging
+            # 1 second per tick - allows proper foraging; sleep only the remainder
+            next_tick += 1.0
+            delay = next_tick - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                # Overran the tick: resync instead of bursting to catch up
+                next_tick = time.monotonic()
+                tick_overruns += 1
             
             # Memory management - clean up old data every 1000 days
             if day % 1000 == 0:
                 print(f"🧹 Day {day}: Performing memory cleanup...")
                 # Clean up old food items to prevent memory bloat
                 data_ecosystem.cleanup_old_food()
-                # Clean up old organism saves
-                persistence_system.cleanup_old_saves(keep_recent=100)
+                # Clean up old organism saves off the tick thread
+                io_pool.submit(persistence_system.cleanup_old_saves, keep_recent=100)
         
     except KeyboardInterrupt:
         print(f"\n🛑 Manual stop requested at day {day}")
@@ -3048,6 +3231,9 @@ if __name__ == "__main__":
         llm_stats = llm_teacher.get_teaching_statistics()
         print(f"LLM teacher: {llm_stats}")
         
+        # Let pending pruning finish before reporting and the final save
+        io_pool.shutdown(wait=True)
+        
         # Show persistence statistics
         persistence_stats = persistence_system.get_save_statistics()
         print(f"Persistence: {persistence_stats}")
@@ -3064,7 +3250,7 @@ if __name__ == "__main__":
         
         # Fallback to original mock system
         parent_system = ParentHelp()
-        organisms = [Organism(generation=0) for _ in range(3)]
+        organisms = [Organism(generation=0, parent_connection=parent_system) for _ in range(3)]
         
         for day in range(100):
             for organism in organisms:
@@ -3100,6 +3286,10 @@ def run_indefinite_zoo(config: dict = None):
         from genesis.code_evolution import create_code_evolution_system
         from genesis.persistence import create_persistence_system, auto_save_organisms
         from genesis.llm_teacher import create_llm_teacher_system, enhance_parent_care_with_llm
+        try:
+            from genesis.interactions import run_region_interactions
+        except Exception:
+            run_region_interactions = None
         try:
             from genesis.ecosystem import build_config_from_env as _build_cfg
         except Exception:
@@ -3163,7 +3353,8 @@ def run_indefinite_zoo(config: dict = None):
         if llm_teacher:
             parent_care_system = enhance_parent_care_with_llm(parent_care_system, llm_teacher)
         
-        # Create parent help system with economy (for advanced help)
+        # Parent help system with economy (for advanced help); the same
+        # parent the organisms ask, so the batch pass serves their requests
         parent_system = ParentHelp()
         
         # Check if we should continue from saved state or start fresh
@@ -3174,11 +3365,13 @@ def run_indefinite_zoo(config: dict = None):
         if latest_save:
             print(f"📂 Found saved state - loading generation {latest_save['generation']}")
             organisms = persistence_system.load_generation(latest_save['file_path'])
+            for organism in organisms:
+                organism.parent_connection = parent_system
             current_generation = latest_save['generation']
             print(f"🔄 Resumed with {len(organisms)} organisms from generation {current_generation}")
         else:
             # Birth multiple organisms
-            organisms = [Organism(generation=0) for _ in range(3)]
+            organisms = [Organism(generation=0, parent_connection=parent_system) for _ in range(3)]
             current_generation = 0
             print(f"🐣 Born {len(organisms)} organisms")
         
@@ -3210,45 +3403,64 @@ def run_indefinite_zoo(config: dict = None):
                     if ok:
                         accepted.append(ch)
                         try:
-                            from genesis.stream import doom_feed
                             doom_feed.add('trial_accept', f"{ch.id}", 1, {'organism': ch.id})
                         except Exception:
                             pass
                     else:
                         rejected.append(ch)
                         try:
-                            from genesis.stream import doom_feed
                             doom_feed.add('trial_reject', f"{ch.id}", 2)
                         except Exception:
                             pass
                 return accepted, rejected
         trial_mgr = _BehaviorTrialManager()
-        
+
+        # Periodic task cadences are fixed for the run; resolve them once
+        perf_config = config.get('performance', {})
+        status_interval = perf_config.get('status_report_interval', 50)
+        status_verbose = perf_config.get('verbose_status', True)
+        parent_system.economy.verbose = perf_config.get('verbose_help', True)
+        lightweight_mode = config.get('lightweight_mode', False)
+        # Single worker for retention pruning, which only touches saved files
+        # and never the live organisms
+        io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='zoo-io')
+        
+        # Bound methods used every tick, looked up once instead of per tick
+        get_eco_stats = data_ecosystem.get_ecosystem_stats
+        update_scarcity = nutrition_system['scarcity_manager'].update_scarcity
+        rand = random.random
+        
+        # Wall-clock deadline of the next tick; pacing subtracts compute time
+        next_tick = time.monotonic()
+        tick_overruns = 0  # ticks whose compute exceeded the 1s budget
         while True:  # INDEFINITE RUNTIME - run forever until manually stopped
             tick += 1
             # Update scarcity based on current ecosystem state
-            eco_stats = data_ecosystem.get_ecosystem_stats()
-            nutrition_system['scarcity_manager'].update_scarcity(eco_stats, len(organisms))
+            eco_stats = get_eco_stats()
+            update_scarcity(eco_stats, len(organisms))
             
             # CRISIS DETECTION AND RESPONSE
-            population_crisis_level = sum(1 for org in organisms if org.energy < 30) / len(organisms)
+            population_crisis_level = _energy_crisis_fraction(organisms)
             
             # Improved food crisis detection - consider both availability and organism population
-            total_food = eco_stats.get('total_food_available', 0)
-            organisms_count = len(organisms)
-            food_per_organism = total_food / max(organisms_count, 1)
+            total_food = eco_stats['total_food_available']
+            organisms_count = max(len(organisms), 1)
             
             # Crisis if less than 2 food items per organism AND low total food
-            food_crisis = (food_per_organism < 2.0 and total_food < 10) or total_food < 1
-            
-            # Only print crisis messages occasionally to reduce spam
-            if (population_crisis_level > 0.7 or food_crisis) and tick % 50 == 0:
-                print(f"🚨 ECOSYSTEM CRISIS: Population crisis {population_crisis_level:.2f}, Food crisis: {food_crisis}")
-                print(f"   Food stats: {total_food} total, {food_per_organism:.1f} per organism")
+            # (compared as total < 2 * count, so no per-tick division)
+            food_crisis = total_food < 1 or (total_food < 10 and total_food < 2.0 * organisms_count)
             
-            if population_crisis_level > 0.7 or food_crisis:
-                # Emergency parent budget boost
-                parent_care_system.emergency_budget_boost(population_crisis_level)
+            in_crisis = population_crisis_level > 0.7 or food_crisis
+            if in_crisis:
+                # Only print crisis messages occasionally to reduce spam
+                if tick % 50 == 0:
+                    print(f"🚨 ECOSYSTEM CRISIS: Population crisis {population_crisis_level:.2f}, Food crisis: {food_crisis}\n"
+                          f"   Food stats: {total_food} total, {total_food / organisms_count:.1f} per organism")
+                
+                # Emergency parent budget boost, throttled: the boost compounds
+                # on the current budget, so boosting every tick overshoots
+                if tick % 5 == 0:
+                    parent_care_system.emergency_budget_boost(population_crisis_level)
                 
                 # Reset parent energy during crisis
                 if day % 10 == 0:  # More frequent resets during crisis
@@ -3258,33 +3470,41 @@ def run_indefinite_zoo(config: dict = None):
             for organism in organisms:
                 organism.live(data_ecosystem, nutrition_system, parent_care_system)
                 
-                # Calculate fitness and apply cultural evolution
-                eco_stats = data_ecosystem.get_ecosystem_stats()
+                # Calculate fitness and apply cultural evolution against the
+                # tick's ecosystem snapshot taken above
                 apply_fitness_culture(organism, eco_stats, fitness_culture_system)
 
             # Region-local interactions (Task 6): teaching and trade
             try:
-                if day % 2 == 0:  # light periodicity to limit noise
-                    from genesis.interactions import run_region_interactions
-                    inter_summary = run_region_interactions(organisms, eco_stats)
-                    # Surface a compact summary occasionally
-                    if inter_summary and (inter_summary.get('teaching_events', 0) > 0 or inter_summary.get('trade_leads', 0) > 0):
-                        from genesis.stream import doom_feed
+                if run_region_interactions is not None and day % 2 == 0:  # light periodicity to limit noise
+                    inter_summary = run_region_interactions(organisms, eco_stats) or {}
+                    teaching = inter_summary.get('teaching_events', 0)
+                    trades = inter_summary.get('trade_leads', 0)
+                    # Surface a compact summary only when something happened
+                    if (teaching > 0 or trades > 0) and doom_feed:
+                        region_stats = inter_summary.get('regions')
                         regions = ','.join(
                             f"{r}:pop={d.get('population',0)},comp={d.get('competition',0):.2f}"
-                            for r, d in inter_summary.get('regions', {}).items()
-                        )
-                        doom_feed.add('interactions', f"teach={inter_summary.get('teaching_events',0)}, trade={inter_summary.get('trade_leads',0)} [{regions}]", 1)
+                            for r, d in region_stats.items()
+                        ) if region_stats else ''
+                        doom_feed.add('interactions', f"teach={teaching}, trade={trades} [{regions}]", 1)
             except Exception:
                 pass
             
-            # Check for reproduction opportunities
-            reproduction_candidates = [org for org in organisms if org.can_reproduce()]
+            # Check for reproduction opportunities; only the first two ready
+            # organisms are tried, so stop scanning once they are found
+            reproduction_candidates = list(islice(filter(Organism.can_reproduce, organisms), 2))
             if len(reproduction_candidates) >= 2:
+                mate_index = None
                 # Try to reproduce some organisms
                 for organism in reproduction_candidates[:2]:  # Limit reproductions
-                    mate = organism.find_mate(organisms)
-                    if mate and random.random() < 0.1:  # 10% chance per tick
+                    # 10% chance per tick; drawn first so most ticks skip the mate search
+                    if rand() >= 0.1:
+                        continue
+                    if mate_index is None:
+                        mate_index = Organism.build_mate_index(organisms)
+                    mate = organism.find_mate(organisms, mate_index)
+                    if mate:
                         child = organism.reproduce(mate, fitness_culture_system)
                         if child:
                             if getattr(child, 'in_trial', False):
@@ -3298,72 +3518,63 @@ def run_indefinite_zoo(config: dict = None):
                 organisms.extend(accepted)
             
             # Process batched help requests
-            if day % 10 == 0:
-                result = parent_system.process_batch_requests()
-                if result and result['helped'] > 0:
-                    print(f"🆘 Help Summary: {result['helped']} helped, {result['cached']} cached")
+            result = parent_system.process_batch_if_due(day)
+            if result and result['helped'] > 0:
+                print(f"🆘 Help Summary: {result['helped']} helped, {result['cached']} cached")
             
-            # Show ecosystem status (with configurable interval)
-            status_interval = config.get('performance', {}).get('status_report_interval', 50)
-            if day % status_interval == 0:
-                print(f"\n=== Day {day}: Ecosystem Status ===")
+            # Show ecosystem status (with configurable interval; can be silenced)
+            if status_verbose and day % status_interval == 0:
+                # The whole report is collected and written as one block
+                report = [f"\n=== Day {day}: Ecosystem Status ==="]
                 
                 # Organism status
-                for i, organism in enumerate(organisms):
-                    emotional_state = organism.get_emotional_state()
-                    can_ask_for_help = "🙋" if organism.has_capability(Capability.ASK_PARENT) else "🤐"
-                    can_reproduce_symbol = "💕" if organism.can_reproduce() else "⭕"
-                    fitness = getattr(organism, 'current_fitness', 0.0)
-                    
-                    # Show organism knowledge
-                    knowledge_info = ""
-                    if hasattr(organism, 'knowledge_base') and organism.knowledge_base:
-                        summary = organism.knowledge_base.get_knowledge_summary()
-                        if summary['total_insights'] > 0:
-                            knowledge_info = f", Insights={summary['total_insights']}"
-                            if summary['expertise_areas']:
-                                knowledge_info += f", Expertise={summary['expertise_areas'][0]}"
-                    
-                    print(f"  🦠 Organism {i+1} (gen {organism.generation}): Energy={organism.energy:.1f}, "
-                          f"Caps={len(organism.capabilities)}, Age={organism.age}, "
-                          f"Fitness={fitness:.2f}, State={emotional_state} {can_ask_for_help}{can_reproduce_symbol}{knowledge_info}")
+                for i, organism in enumerate(organisms, 1):
+                    report.append(_organism_status_line(i, organism))
                 
                 # Data ecosystem status
                 eco_stats = data_ecosystem.get_ecosystem_stats()
                 scarcity_report = nutrition_system['scarcity_manager'].get_scarcity_report()
                 parent_report = parent_care_system.get_parenting_report()
                 
-                print(f"  🌍 Ecosystem: {eco_stats['total_food_available']} food available")
-                print(f"  🍯 Food types: {eco_stats['food_by_type']}")
-                print(f"  📉 Scarcity: {scarcity_report['scarcity_level']} "
-                      f"(global: {scarcity_report['global_scarcity']:.2f})")
-                print(f"  👨‍👩‍👧‍👦 Parent: {parent_report['feeding_budget_used']} feeding, "
-                      f"{parent_report['interventions_used']} interventions, "
-                      f"success: {parent_report['successful_children']}")
+                report.append(f"  🌍 Ecosystem: {eco_stats['total_food_available']} food available")
+                report.append(f"  🍯 Food types: {eco_stats['food_by_type']}")
+                report.append(f"  📉 Scarcity: {scarcity_report['scarcity_level']} "
+                              f"(global: {scarcity_report['global_scarcity']:.2f})")
+                report.append(f"  👨‍👩‍👧‍👦 Parent: {parent_report['feeding_budget_used']} feeding, "
+                              f"{parent_report['interventions_used']} interventions, "
+                              f"success: {parent_report['successful_children']}")
+                report.append(f"  ⏱️ Tick overruns: {tick_overruns}/{tick}")
                 
                 # LLM statistics if available
                 if llm_teacher:
                     llm_stats = llm_teacher.get_teaching_statistics()
-                    print(f"  🧠 LLM: {llm_stats['total_conversations']} conversations, "
-                          f"model: {llm_stats['model_used']}")
-                elif config.get('lightweight_mode'):
-                    print(f"  🧠 Teaching: Enhanced fallback responses active")
+                    report.append(f"  🧠 LLM: {llm_stats['total_conversations']} conversations, "
+                                  f"model: {llm_stats['model_used']}")
+                elif lightweight_mode:
+                    report.append(f"  🧠 Teaching: Enhanced fallback responses active")
+                print("\n".join(report))
             
             # Remove dead organisms and evolve population
-            initial_count = len(organisms)
-            organisms = [org for org in organisms if org.energy > 0]
-            deaths = initial_count - len(organisms)
+            deaths = _remove_dead(organisms)
             
             if deaths > 0:
                 print(f"💀 {deaths} organisms died")
                 
-            # Add new organisms to maintain population
-            while len(organisms) < 3:
-                new_gen = max(o.generation for o in organisms) + 1 if organisms else 1
-                organisms.append(Organism(generation=new_gen))
-                print(f"🐣 New organism born (generation {new_gen})")
+            # Add new organisms to maintain population; each newcomer is one
+            # generation past the newest generation alive, earlier newcomers included
+            needed = 3 - len(organisms)
+            if needed > 0:
+                base_gen = max((o.generation for o in organisms), default=0) + 1
+                organisms.extend(Organism(generation=base_gen + i,
+                                          parent_connection=parent_system)
+                                 for i in range(needed))
+                new_gen = base_gen + needed - 1
+                if needed == 1:
+                    print(f"🐣 New organism born (generation {new_gen})")
+                else:
+                    print(f"🐣 {needed} new organisms born (generations {base_gen}-{new_gen})")
                 
-                # Update current generation tracking
+                # Update current generation tracking once per refill
                 current_generation = max(current_generation, new_gen)
             
             # Auto-save organisms every 50 days
@@ -3372,15 +3583,23 @@ def run_indefinite_zoo(config: dict = None):
             
             day += 1  # Increment day counter
             # SLOWER SIMULATION: Give organisms time to forage and discover
-            time.sleep(1.0)  # 1 second per tick - allows proper foraging
+            # 1 second per tick - allows proper foraging; sleep only the remainder
+            next_tick += 1.0
+            delay = next_tick - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                # Overran the tick: resync instead of bursting to catch up
+                next_tick = time.monotonic()
+                tick_overruns += 1
             
             # Memory management - clean up old data every 1000 days
             if day % 1000 == 0:
                 print(f"🧹 Day {day}: Performing memory cleanup...")
                 # Clean up old food items to prevent memory bloat
                 data_ecosystem.cleanup_old_food()
-                # Clean up old organism saves
-                persistence_system.cleanup_old_saves(keep_recent=100)
+                # Clean up old organism saves off the tick thread
+                io_pool.submit(persistence_system.cleanup_old_saves, keep_recent=100)
         
     except KeyboardInterrupt:
         print(f"\n🛑 Manual stop requested at day {day}")
@@ -3399,6 +3618,9 @@ def run_indefinite_zoo(config: dict = None):
             llm_stats = llm_teacher.get_teaching_statistics()
             print(f"LLM teacher: {llm_stats}")
         
+        # Let pending pruning finish before reporting and the final save
+        io_pool.shutdown(wait=True)
+        
         # Show persistence statistics
         persistence_stats = persistence_system.get_save_statistics()
         print(f"Persistence: {persistence_stats}")
@@ -27,6 +27,16 @@ try:
 except Exception:
     _naming_game = None
 
+try:
+    from genesis.stream import doom_feed
+except Exception:
+    doom_feed = None
+
+try:
+    from data_sources.harvesters import DataType
+except Exception:
+    DataType = None
+
 
 def run_region_interactions(organisms: List, ecosystem_stats: Dict[str, Any]) -> Dict[str, Any]:
     """Process simple region-local interactions between organisms.
@@ -213,7 +223,6 @@ def run_region_interactions(organisms: List, ecosystem_stats: Dict[str, Any]) ->
                 continue
             best = max(mems[-5:], key=lambda m: m.get('energy_gained', 0.0))
             try:
-                from data_sources.harvesters import DataType
                 ft = best.get('food_type')
                 if isinstance(ft, DataType):
                     trade_board.post_lead(o.id, ft, best.get('source', region), best.get('energy_gained', 0.0), region=region)
@@ -248,8 +257,7 @@ def run_region_interactions(organisms: List, ecosystem_stats: Dict[str, Any]) ->
 
         # Low-noise per-region summary event for observability
         try:
-            if random.random() < 0.1:
-                from genesis.stream import doom_feed
+            if random.random() < 0.1 and doom_feed:
                 doom_feed.add('region', f"{region}: pop={pop}, comp={region_comp:.2f}", 1)
         except Exception:
             pass
@@ -243,7 +243,7 @@ Keep response under 100 characters. Be helpful but encourage independence. Match
         """Extract organism's real knowledge and expertise for teaching context"""
         
         # Check if organism has knowledge base
-        if not hasattr(organism, 'knowledge_base'):
+        if getattr(organism, 'knowledge_base', None) is None:
             return "- No accumulated knowledge yet. Fresh mind, ready to learn."
         
         kb = organism.knowledge_base
@@ -338,7 +338,7 @@ Keep response under 100 characters. Be helpful but encourage independence. Match
     def _enhance_fallback_with_knowledge(self, organism, base_advice: str, teaching_mode: TeachingMode) -> str:
         """Enhance fallback responses with organism's real knowledge"""
         
-        if not hasattr(organism, 'knowledge_base'):
+        if getattr(organism, 'knowledge_base', None) is None:
             return base_advice
         
         kb = organism.knowledge_base
@@ -8,11 +8,15 @@ from dataclasses import dataclass
 from enum import Enum
 import math
 
-# Import from data sources
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from data_sources.harvesters import DataType, DataMorsel
+# Import from data sources; the package root is only put on sys.path when
+# the module is run from a checkout that is not already importable
+try:
+    from data_sources.harvesters import DataType, DataMorsel
+except ImportError:
+    import sys
+    import os
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from data_sources.harvesters import DataType, DataMorsel
 
 class NutritionalCategory(Enum):
     """Categories of nutritional value"""
@@ -160,7 +164,7 @@ class NutritionDatabase:
         mem_tokens: List[str] = []
         try:
             if hasattr(organism, 'memory'):
-                for m in organism.memory[-50:]:
+                for m in list(organism.memory)[-50:]:
                     mem_tokens.extend(str(m).lower().split())
             if hasattr(organism, 'knowledge_base') and getattr(organism.knowledge_base, 'knowledge_items', None):
                 for ki in organism.knowledge_base.knowledge_items[-20:]:
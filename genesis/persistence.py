@@ -68,7 +68,7 @@ class OrganismPersistence:
                     getattr(organism.traits, attr), (int, float, str, bool)
                 )
             },
-            'memory': organism.memory[-50:] if getattr(organism, 'memory', None) else [],
+            'memory': list(organism.memory)[-50:] if getattr(organism, 'memory', None) else [],
             'code_modifications': []
         }
         # Task 7: persist small slice of social learning state (bounded)
@@ -175,7 +175,7 @@ class OrganismPersistence:
                 if hasattr(organism.traits, attr):
                     setattr(organism.traits, attr, val)
 
-            organism.memory = organism_data.get('memory', [])
+            organism.memory.extend(organism_data.get('memory', []))
             organism.unique_food_sources = set(
                 organism_data.get('unique_food_sources', [])
             )
@@ -471,7 +471,7 @@ class DBPersistence:
                     getattr(organism.traits, attr), (int, float, str, bool)
                 )
             },
-            'memory': organism.memory[-50:] if getattr(organism, 'memory', None) else [],
+            'memory': list(organism.memory)[-50:] if getattr(organism, 'memory', None) else [],
             'code_modifications': []
         }
         # Task 7: persist a tiny slice of social state
@@ -545,7 +545,7 @@ class DBPersistence:
             for attr, val in organism_data.get('traits', {}).items():
                 if hasattr(organism.traits, attr):
                     setattr(organism.traits, attr, val)
-            organism.memory = organism_data.get('memory', [])
+            organism.memory.extend(organism_data.get('memory', []))
             organism.unique_food_sources = set(
                 organism_data.get('unique_food_sources', [])
             )
@@ -625,7 +625,7 @@ class DBPersistence:
                             getattr(org.traits, attr), (int, float, str, bool)
                         )
                     },
-                    'memory': org.memory[-50:] if getattr(org, 'memory', None) else [],
+                    'memory': list(org.memory)[-50:] if getattr(org, 'memory', None) else [],
                     'code_modifications': []
                 }
                 if hasattr(org, 'brain_genome') and org.brain_genome is not None:
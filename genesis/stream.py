@@ -7,6 +7,7 @@ printed now and later streamed to a UI.
 from __future__ import annotations
 
 import time
+from contextlib import contextmanager
 from typing import Any, Dict, List, Optional, Iterable
 import threading
 
@@ -18,8 +19,14 @@ class DoomFeed:
         self._lock = threading.Lock()
         self._cv = threading.Condition(self._lock)
         self._seq = 0  # monotonically increasing event id
+        self._local = threading.local()  # per-thread batch opened by batched()
 
     def add(self, tag: str, message: str, importance: int = 1, meta: Optional[Dict[str, Any]] = None):
+        held = getattr(self._local, 'held', None)
+        if held is not None:
+            # Inside batched(): keep the event, stamped now, for the batch
+            held.append((tag, message, importance, meta, time.time()))
+            return
         with self._lock:
             self._seq += 1
             evt = {
@@ -35,12 +42,65 @@ class DoomFeed:
                 self.events = self.events[-self.max_items:]
             self._cv.notify_all()
         # Immediate console echo for now (later replace with stream push)
+        self._echo(tag, message, importance)
+
+    def add_many(self, items: Iterable[tuple]):
+        """
+        Append a batch of (tag, message, importance, meta[, ts]) events under a
+        single lock acquisition and wake waiters once. Events without a ts are
+        stamped with the time of the call.
+        """
+        items = list(items)
+        if not items:
+            return
+        with self._lock:
+            now = time.time()
+            for item in items:
+                tag, message, importance, meta = item[:4]
+                self._seq += 1
+                self.events.append({
+                    'id': self._seq,
+                    'ts': item[4] if len(item) > 4 else now,
+                    'tag': tag,
+                    'message': message,
+                    'importance': importance,
+                    'meta': meta or {}
+                })
+            if len(self.events) > self.max_items:
+                self.events = self.events[-self.max_items:]
+            self._cv.notify_all()
+        # One console write for the whole batch
+        print("\n".join(self._format(*item[:3]) for item in items))
+
+    @contextmanager
+    def batched(self):
+        """
+        Hold every event this thread adds until the block exits, then publish
+        them with add_many() in the order they were added, each keeping the
+        time it was added. Nested blocks join the outermost batch.
+        """
+        if getattr(self._local, 'held', None) is not None:
+            yield
+            return
+        self._local.held = []
+        try:
+            yield
+        finally:
+            held, self._local.held = self._local.held, None
+            self.add_many(held)
+
+    @staticmethod
+    def _format(tag: str, message: str, importance: int) -> str:
         prefix = {
             3: '🌋',
             2: '🔥',
             1: '✨'
         }.get(importance, '✨')
-        print(f"{prefix} {tag}: {message}")
+        return f"{prefix} {tag}: {message}"
+
+    @classmethod
+    def _echo(cls, tag: str, message: str, importance: int):
+        print(cls._format(tag, message, importance))
 
     def get_recent(self, n: int = 50) -> List[Dict[str, Any]]:
         with self._lock:
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Tests for resizing a brain's input and output layers in place.
+"""
+
+import copy
+
+from genesis.brain import Brain, BrainGenome
+
+
+def _assert_grown(brain, old, new_in, new_out):
+    in_dim, hid_dim, out_dim = old['topology']['in'], old['topology']['hid'], old['topology']['out']
+    assert brain.topology['in'] == new_in
+    assert brain.topology['out'] == new_out
+
+    # Learned weights are kept
+    assert brain.w1[:in_dim] == old['w1']
+    assert brain.b1 == old['b1']
+    assert [row[:out_dim] for row in brain.w2] == old['w2']
+    assert brain.b2[:out_dim] == old['b2']
+
+    # New input rows and output columns are initialised in range
+    assert len(brain.w1) == new_in
+    assert all(len(row) == hid_dim and all(-1.0 <= w <= 1.0 for w in row)
+               for row in brain.w1[in_dim:])
+    assert len(brain.w2) == hid_dim
+    assert all(len(row) == new_out and all(-1.0 <= w <= 1.0 for w in row[out_dim:])
+               for row in brain.w2)
+    assert len(brain.b2) == new_out
+    assert all(-0.1 <= b <= 0.1 for b in brain.b2[out_dim:])
+
+    assert len(brain.forward([0.5] * new_in)) == new_out
+
+
+def test_reshape_keeps_weights_and_initialises_new_rows():
+    genome = BrainGenome.random()
+    old = copy.deepcopy(genome.data)
+    brain = Brain(genome)
+    new_in, new_out = old['topology']['in'] + 2, old['topology']['out'] + 1
+
+    brain.reshape(new_in, new_out)
+    _assert_grown(brain, old, new_in, new_out)
+    assert genome.data['topology']['in'] == new_in
+    assert genome.data['topology']['out'] == new_out
+
+
+def test_reshape_records_sizes_when_genome_has_no_topology():
+    genome = BrainGenome.random()
+    old = copy.deepcopy(genome.data)
+    del genome.data['topology']
+    brain = Brain(genome)
+    new_in, new_out = old['topology']['in'] + 1, old['topology']['out'] + 2
+
+    brain.reshape(new_in, new_out)
+    _assert_grown(brain, old, new_in, new_out)
+    assert genome.data['topology'] == {'in': new_in, 'hid': old['topology']['hid'], 'out': new_out}
+
+    # A second reshape starts from the recorded sizes
+    brain.reshape(new_in + 1, new_out)
+    assert len(brain.w1) == new_in + 1
+    assert brain.w1[:old['topology']['in']] == old['w1']
+
+
+def test_interface_adaptation_reshapes_the_live_brain():
+    from genesis.evolution import Organism
+
+    organism = Organism()
+    brain = organism.brain
+    old = copy.deepcopy(organism.brain_genome.data)
+    organism._last_sensor_map = {
+        'toxicity_buildup': 0.9, 'metabolic_efficiency': 0.5,
+        'recent_success': 0.1, 'competition_local': 0.9,
+    }
+    organism._adapt_brain_interfaces_based_on_experience()
+
+    genome = organism.brain_genome.data
+    assert organism.brain is brain
+    assert 'migrate' in genome['actuators']
+    assert brain.topology['in'] == len(genome['sensors']) == len(brain.w1)
+    assert brain.topology['out'] == len(genome['actuators']) == len(brain.b2)
+    assert brain.w1[:old['topology']['in']] == old['w1'][:len(brain.w1)]
+    assert len(brain.forward([0.5] * brain.topology['in'])) == brain.topology['out']
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Tests for batched doom feed events.
+"""
+
+import threading
+import time
+
+import pytest
+
+import genesis.evolution as evolution
+from genesis.evolution import Organism
+from genesis.stream import DoomFeed
+
+
+def test_add_many_keeps_order_and_ids():
+    feed = DoomFeed()
+    feed.add('first', 'one')
+    feed.add_many([('batch', f'msg {i}', 1, {'i': i}) for i in range(5)])
+    events = feed.export()
+    assert [e['message'] for e in events] == ['one'] + [f'msg {i}' for i in range(5)]
+    assert [e['id'] for e in events] == list(range(1, 7))
+    assert events[3]['meta'] == {'i': 2}
+
+
+def test_add_many_wakes_waiters():
+    feed = DoomFeed()
+    feed.add('start', 'ready')
+    received = []
+    waiter = threading.Thread(target=lambda: received.extend(feed.wait_for(1, timeout=5.0)))
+    waiter.start()
+    time.sleep(0.1)  # let the waiter block on the condition
+    feed.add_many([('batch', 'a', 1, None), ('batch', 'b', 2, None)])
+    waiter.join(timeout=5.0)
+    assert not waiter.is_alive()
+    assert [e['message'] for e in received] == ['a', 'b']
+
+
+def test_add_many_respects_max_items():
+    feed = DoomFeed(max_items=3)
+    feed.add_many([('batch', str(i), 1, None) for i in range(5)])
+    assert [e['message'] for e in feed.export()] == ['2', '3', '4']
+
+
+def test_live_flushes_events_when_tick_raises(monkeypatch):
+    feed = DoomFeed()
+    monkeypatch.setattr(evolution, 'doom_feed', feed)
+
+    def failing_tick(self, *args):
+        self._feed('test', 'before failure', 2)
+        self._feed('test', 'still before failure', 1)
+        raise RuntimeError('tick failed')
+
+    monkeypatch.setattr(Organism, '_live_tick', failing_tick)
+    organism = Organism()
+    with pytest.raises(RuntimeError):
+        organism.live()
+    assert [e['message'] for e in feed.export()] == ['before failure', 'still before failure']
+
+    # Outside a tick, events go straight to the feed again
+    organism._feed('test', 'after', 1)
+    assert feed.export()[-1]['message'] == 'after'
+
+
+def test_later_organisms_hear_earlier_chatter_in_the_same_tick(monkeypatch):
+    feed = DoomFeed()
+    monkeypatch.setattr(evolution, 'doom_feed', feed)
+    heard = {}
+
+    def tick(self, *args):
+        # Passive listening reads the shared feed, as organisms do
+        heard[self.id] = [e['message'] for e in feed.get_recent(10)]
+        self._feed('chatter', f'{self.id} says hi', 1)
+
+    monkeypatch.setattr(Organism, '_live_tick', tick)
+    first, second = Organism(), Organism()
+    for organism in (first, second):
+        organism.live()
+    assert heard[first.id] == []
+    assert heard[second.id] == [f'{first.id} says hi']
+
+
+def test_add_many_keeps_given_timestamps():
+    feed = DoomFeed()
+    feed.add_many([('old', 'a', 1, None, 100.0), ('new', 'b', 1, None)])
+    first, second = feed.export()
+    assert first['ts'] == 100.0
+    assert second['ts'] > 100.0
+
+
+def test_batched_events_keep_capture_order_and_time(monkeypatch):
+    feed = DoomFeed()
+    monkeypatch.setattr(evolution, 'doom_feed', feed)
+    organism = Organism()
+    stamps = iter([10.0, 20.0, 30.0, 99.0])
+    monkeypatch.setattr('genesis.stream.time.time', lambda: next(stamps))
+
+    def tick(self, *args):
+        self._feed('organism', 'first', 1)
+        # Direct adds, as ParentEconomy and the trade board make, join the batch
+        feed.add('parent_help', 'second', 1)
+        self._feed('organism', 'third', 1)
+
+    monkeypatch.setattr(Organism, '_live_tick', tick)
+    organism.live()
+    events = feed.export()
+    assert [e['message'] for e in events] == ['first', 'second', 'third']
+    assert [e['ts'] for e in events] == [10.0, 20.0, 30.0]
+
+
+def test_nested_batches_publish_once_with_the_outer_block():
+    feed = DoomFeed()
+    with feed.batched():
+        feed.add('outer', 'a')
+        with feed.batched():
+            feed.add('inner', 'b')
+        assert feed.export() == []
+        feed.add('outer', 'c')
+    assert [e['message'] for e in feed.export()] == ['a', 'b', 'c']
+    # Outside a batch, events are published immediately again
+    feed.add('after', 'd')
+    assert feed.export()[-1]['message'] == 'd'
+
+
+def test_batches_are_per_thread():
+    feed = DoomFeed()
+    with feed.batched():
+        worker = threading.Thread(target=feed.add, args=('harvest', 'other thread'))
+        worker.start()
+        worker.join()
+        assert [e['message'] for e in feed.export()] == ['other thread']
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Tests for the cached data ecosystem statistics.
+"""
+
+import time
+
+from data_sources.harvesters import DataEcosystem, DataMorsel, DataType, FileSystemHarvester
+from genesis.evolution import Capability
+
+
+def _ecosystem(monkeypatch, tmp_path):
+    # No watcher or harvest thread: the test drives storage directly
+    monkeypatch.setattr(FileSystemHarvester, 'start_watching', lambda self: None)
+    monkeypatch.setattr(DataEcosystem, '_harvest_loop', lambda self: None)
+    return DataEcosystem({
+        'rss_feeds': [],
+        'watch_paths': [str(tmp_path)],
+        'enable_synthetic_feeder': False,
+        'scarcity_threshold': 10,
+    })
+
+
+def _morsel(text, age=0.0, data_type=DataType.SIMPLE_TEXT):
+    return DataMorsel(data_type=data_type, content=text, size=len(text),
+                      source='test', timestamp=time.time() - age, energy_value=10)
+
+
+def test_stats_follow_add_consume_and_purge(monkeypatch, tmp_path):
+    eco = _ecosystem(monkeypatch, tmp_path)
+    assert eco.get_ecosystem_stats()['total_food_available'] == 0
+
+    # Add
+    eco._store_harvest([_morsel('fresh one'), _morsel('fresh two'),
+                        _morsel('stale', age=10 * 3600)], full_pass=False)
+    stats = eco.get_ecosystem_stats()
+    assert stats['total_food_available'] == 3
+    assert stats['total_energy_available'] == 30
+    assert stats['food_by_type'] == {'simple_text': 3}
+
+    # Consume
+    assert eco.find_food_for_organism({Capability.EAT_TEXT}) is not None
+    stats = eco.get_ecosystem_stats()
+    assert stats['total_food_available'] == 2
+    assert stats['total_food_consumed'] == 1
+
+    # Purge: the full pass decays freshness and drops the stale morsel,
+    # without changing how many morsels were consumed
+    eco._store_harvest([], full_pass=True)
+    stats = eco.get_ecosystem_stats()
+    assert stats['total_food_available'] == len(eco.available_food) == 1
+    assert stats['total_food_consumed'] == 1
+    assert stats['average_freshness'] == eco.available_food[0].freshness
+
+    # Decay alone leaves every count unchanged; the pass still invalidates
+    before = stats['average_freshness']
+    eco.available_food[0].timestamp -= 3600
+    eco._store_harvest([], full_pass=True)
+    assert eco.get_ecosystem_stats()['average_freshness'] < before
+
+
+def test_stats_are_per_instance_and_not_shared(monkeypatch, tmp_path):
+    first = _ecosystem(monkeypatch, tmp_path)
+    second = _ecosystem(monkeypatch, tmp_path)
+    first._store_harvest([_morsel('only in first')], full_pass=False)
+    first.get_ecosystem_stats()
+    assert second.get_ecosystem_stats()['total_food_available'] == 0
+
+    # Callers get their own copy; editing it does not leak into later reads
+    stats = first.get_ecosystem_stats()
+    stats['total_food_available'] = 99
+    stats['food_by_type']['code'] = 5
+    again = first.get_ecosystem_stats()
+    assert again['total_food_available'] == 1
+    assert again['food_by_type'] == {'simple_text': 1}
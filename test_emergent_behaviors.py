@@ -102,7 +102,7 @@ def test_emergent_behaviors():
             organism.exhibit_knowledge_based_behaviors()
             
             # Show knowledge progress
-            if hasattr(organism, 'knowledge_base'):
+            if getattr(organism, 'knowledge_base', None):
                 summary = organism.knowledge_base.get_knowledge_summary()
                 print(f"Knowledge: {summary['total_insights']} insights, Activity: {summary['learning_activity']}")
                 if summary['expertise_areas']:
@@ -125,7 +125,7 @@ def test_emergent_behaviors():
         print("\n🌟 EMERGENT BEHAVIOR SUMMARY")
         print("=" * 40)
         
-        if hasattr(organism, 'knowledge_base'):
+        if getattr(organism, 'knowledge_base', None):
             final_summary = organism.knowledge_base.get_knowledge_summary()
             print(f"Total Knowledge: {final_summary['total_insights']} insights")
             print(f"Expertise Areas: {final_summary['expertise_areas']}")
@@ -147,7 +147,7 @@ def test_emergent_behaviors():
         print(f"  - Risk Taking: {organism.traits.risk_taking:.2f} (higher = more adventurous)")
         
         special_abilities = []
-        if hasattr(organism, '_problem_solver'):
+        if getattr(organism, '_problem_solver', False):
             special_abilities.append("Cross-domain problem solver")
         if hasattr(organism, '_behavior_modifiers'):
             if organism._behavior_modifiers.get('tech_awareness', 0) > 0.3:
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Tests for RSS conditional fetches and event-driven file harvesting.
+"""
+
+import time
+from types import SimpleNamespace
+
+import data_sources.harvesters as harvesters
+from data_sources.harvesters import (APIHarvester, DataEcosystem, FileSystemHarvester,
+                                     RSSFeedHarvester)
+
+
+class _Feed(dict):
+    """feedparser result stand-in: dict keys plus entries/feed attributes"""
+
+    def __init__(self, status, entries=(), etag=None, modified=None):
+        super().__init__(status=status)
+        if etag:
+            self['etag'] = etag
+        if modified:
+            self['modified'] = modified
+        self.entries = list(entries)
+        self.feed = SimpleNamespace(title='Test Feed')
+
+
+def _entry(n):
+    return SimpleNamespace(id=f'entry-{n}', link=f'https://example.com/{n}',
+                           title=f'Story {n}', summary='summary')
+
+
+def test_rss_sends_validators_and_skips_unchanged_feeds(monkeypatch):
+    calls = []
+    responses = [
+        _Feed(200, [_entry(1), _entry(2)], etag='"v1"', modified='Mon, 01 Jan 2024 00:00:00 GMT'),
+        _Feed(304),
+        _Feed(200, [_entry(2), _entry(3)], etag='"v2"'),
+    ]
+
+    def parse(url, etag=None, modified=None):
+        calls.append((url, etag, modified))
+        return responses.pop(0)
+
+    monkeypatch.setattr(harvesters.feedparser, 'parse', parse)
+    harvester = RSSFeedHarvester(['https://example.com/feed'])
+
+    assert len(harvester.harvest()) == 2
+    assert calls[-1] == ('https://example.com/feed', None, None)
+
+    # Unchanged: the validators go out and a 304 yields nothing
+    assert harvester.harvest() == []
+    assert calls[-1] == ('https://example.com/feed', '"v1"', 'Mon, 01 Jan 2024 00:00:00 GMT')
+    assert harvester.last_check['https://example.com/feed'] == ('"v1"', 'Mon, 01 Jan 2024 00:00:00 GMT')
+
+    # Changed: only the unseen entry is new, and the validators are replaced
+    morsels = harvester.harvest()
+    assert [m.content.splitlines()[0] for m in morsels] == ['Title: Story 3']
+    assert harvester.last_check['https://example.com/feed'] == ('"v2"', None)
+
+
+def test_rss_keeps_configured_feed_order(monkeypatch):
+    urls = [f'https://example.com/{n}' for n in range(4)]
+
+    def parse(url, etag=None, modified=None):
+        n = int(url.rsplit('/', 1)[1])
+        time.sleep(0.01 * (4 - n))  # later feeds answer first
+        return _Feed(200, [_entry(n)])
+
+    monkeypatch.setattr(harvesters.feedparser, 'parse', parse)
+    morsels = RSSFeedHarvester(urls).harvest()
+    assert [m.content.splitlines()[0] for m in morsels] == [f'Title: Story {n}' for n in range(4)]
+
+
+def test_file_chunks_set_wakeup_and_drain_once(tmp_path):
+    path = tmp_path / 'notes.txt'
+    path.write_text('hello world ' * 100)
+    harvester = FileSystemHarvester([str(tmp_path)], chunk_size=512)
+    assert not harvester.wakeup.is_set()
+
+    harvester._process_file(str(path), 'created')
+    assert harvester.wakeup.is_set()
+    assert len(harvester.get_harvested_morsels()) == 3
+    assert harvester.get_harvested_morsels() == []
+
+
+def test_harvest_loop_wakes_for_file_food(monkeypatch, tmp_path):
+    # No watcher thread or network: the test plays the watcher itself
+    monkeypatch.setattr(FileSystemHarvester, 'start_watching', lambda self: None)
+    monkeypatch.setattr(FileSystemHarvester, 'stop_watching', lambda self: None)
+    monkeypatch.setattr(APIHarvester, 'harvest', lambda self: [])
+    eco = DataEcosystem({
+        'rss_feeds': [],
+        'watch_paths': [str(tmp_path)],
+        'harvest_interval': 3600,
+        'enable_synthetic_feeder': False,
+    })
+    try:
+        path = tmp_path / 'food.txt'
+        path.write_text('fresh file food')
+        eco.file_harvester._process_file(str(path), 'created')
+
+        # Well before the hour-long interval, the loop has stored the chunk
+        deadline = time.monotonic() + 5.0
+        while not eco.available_food and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert [m.content for m in eco.available_food] == ['fresh file food']
+    finally:
+        started = time.monotonic()
+        eco.stop()
+    # stop() wakes the sleeping loop instead of waiting out the interval
+    assert not eco.harvest_thread.is_alive()
+    assert time.monotonic() - started < 2.0
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Tests for the knowledge summary and its memoized fields.
+"""
+
+import time
+
+from genesis.data_processor import OrganismKnowledgeBase, ProcessedKnowledge, DataInsight
+
+
+def _knowledge(n):
+    return [
+        ProcessedKnowledge(
+            insight_type=DataInsight.TECHNICAL_CONCEPT,
+            content=f"insight {i}",
+            confidence=0.8,
+            source="RSS:Test",
+            extracted_at=time.time(),
+            keywords=["python", f"topic{i}"],
+            usefulness=0.9,
+        )
+        for i in range(n)
+    ]
+
+
+def test_learning_activity_decays_to_dormant(monkeypatch):
+    import genesis.data_processor as dp
+
+    now = [1_000_000.0]
+    monkeypatch.setattr(dp.time, 'time', lambda: now[0])
+
+    kb = OrganismKnowledgeBase()
+    kb.add_knowledge(_knowledge(3), 'org')
+    assert kb.get_knowledge_summary()['learning_activity'] == 'active'
+
+    # No new learning: the cached counts stay, but activity follows the clock
+    now[0] += 1800
+    assert kb.get_knowledge_summary()['learning_activity'] == 'active'
+    now[0] += 1801
+    summary = kb.get_knowledge_summary()
+    assert summary['learning_activity'] == 'dormant'
+    assert summary['total_insights'] == 3
+
+    kb.add_knowledge(_knowledge(1), 'org')
+    assert kb.get_knowledge_summary()['learning_activity'] == 'moderate'
+
+
+def test_summary_refreshes_after_add_and_is_not_shared():
+    kb = OrganismKnowledgeBase()
+    assert kb.get_knowledge_summary() == {
+        "total_insights": 0, "expertise_areas": [], "learning_activity": "none"}
+
+    kb.add_knowledge(_knowledge(2), 'org')
+    first = kb.get_knowledge_summary()
+    assert first['total_insights'] == 2
+
+    # Callers get their own dict; editing it does not leak into later reads
+    first['total_insights'] = 99
+    first['expertise_areas'].append('bogus')
+    second = kb.get_knowledge_summary()
+    assert second['total_insights'] == 2
+    assert 'bogus' not in second['expertise_areas']
+
+    kb.add_knowledge(_knowledge(1), 'org')
+    assert kb.get_knowledge_summary()['total_insights'] == 3
+    assert kb.insight_count() == 3
@@ -73,7 +73,7 @@ def test_knowledge_extraction():
             organism._process_found_food(data_morsel, nutrition_system)
             
             # Check if knowledge was extracted
-            if hasattr(organism, 'knowledge_base'):
+            if getattr(organism, 'knowledge_base', None):
                 summary = organism.knowledge_base.get_knowledge_summary()
                 print(f"Knowledge extracted: {summary['total_insights']} insights")
                 print(f"Expertise areas: {summary['expertise_areas']}")
@@ -90,7 +90,7 @@ def test_knowledge_extraction():
         
         # Test teaching with real knowledge
         print("\n🧠 Testing LLM Teaching with Real Knowledge...")
-        if hasattr(organism, 'knowledge_base'):
+        if getattr(organism, 'knowledge_base', None):
             # Test different teaching scenarios
             teaching_scenarios = [
                 ("energy_help", {"reason": "Organism struggling with low energy"}),
@@ -109,7 +109,7 @@ def test_knowledge_extraction():
         
         # Final knowledge summary
         print("\n📊 Final Knowledge Summary:")
-        if hasattr(organism, 'knowledge_base'):
+        if getattr(organism, 'knowledge_base', None):
             final_summary = organism.knowledge_base.get_knowledge_summary()
             print(f"Total insights: {final_summary['total_insights']}")
             print(f"Expertise areas: {final_summary['expertise_areas']}")
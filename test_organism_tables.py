@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Tests for organism ids, the mate index and the capability unlock table.
+"""
+
+import itertools
+import random
+
+from genesis.evolution import Organism, Capability
+
+
+def test_ids_and_lexicon_follow_the_global_seed():
+    def births():
+        random.seed(1234)
+        organisms = [Organism() for _ in range(3)]
+        return ([o.id for o in organisms],
+                [o.lexicon.alphabet if o.lexicon else None for o in organisms])
+
+    first = births()
+    assert first == births()
+    assert all(len(i) == 8 for i in first[0])
+    assert len(set(first[0])) == 3
+
+
+def _reference_mate(organism, population):
+    # Linear scan: closest generations, highest fitness, first on ties
+    candidates = [o for o in population
+                  if o is not organism and o.can_reproduce()
+                  and organism.generation - 2 <= o.generation <= organism.generation + 2]
+    if not candidates:
+        return None
+    return max(candidates, key=lambda o: o.current_fitness)
+
+
+def _population(rng, n=30):
+    population = []
+    for _ in range(n):
+        organism = Organism(generation=rng.randrange(6))
+        organism.energy = rng.choice((50, 130))
+        organism.age = rng.choice((10, 90))
+        organism.current_fitness = rng.choice((0.2, 0.5, 0.8))
+        population.append(organism)
+    return population
+
+
+def test_find_mate_matches_linear_scan():
+    rng = random.Random(7)
+    for _ in range(5):
+        population = _population(rng)
+        index = Organism.build_mate_index(population)
+        for organism in population:
+            assert organism.find_mate(population, index) is _reference_mate(organism, population)
+            # Without a prebuilt index the result is the same
+            assert organism.find_mate(population) is _reference_mate(organism, population)
+
+
+def test_find_mate_skips_parents_that_already_reproduced():
+    population = [Organism(generation=1) for _ in range(3)]
+    for organism, fitness in zip(population, (0.9, 0.5, 0.1)):
+        organism.energy, organism.age, organism.current_fitness = 130, 90, fitness
+    index = Organism.build_mate_index(population)
+    seeker = population[2]
+    assert seeker.find_mate(population, index) is population[0]
+
+    # reproduce() clears the snapshot flag; the index is not rebuilt mid-tick
+    population[0]._can_reproduce_cached = False
+    assert seeker.find_mate(population, index) is population[1]
+    population[1]._can_reproduce_cached = False
+    assert seeker.find_mate(population, index) is None
+
+
+def _reference_unlocks(o):
+    caps = o.capabilities
+    unlockable = []
+    if Capability.EAT_TEXT in caps:
+        if o.memory_usage() > 50:
+            unlockable.append(Capability.REMEMBER)
+        if o.age > 100:
+            unlockable.append(Capability.PATTERN_MATCH)
+    if Capability.PATTERN_MATCH in caps and o.social_interactions > 10:
+        unlockable.append(Capability.SIGNAL)
+    if Capability.REMEMBER in caps and Capability.PATTERN_MATCH in caps:
+        if o.successful_predictions > 5:
+            unlockable.append(Capability.PREDICT)
+        if o.traits.creativity > 0.5:
+            unlockable.append(Capability.CREATE)
+    if Capability.ABSTRACT in caps and Capability.CREATE in caps:
+        if o.introspection_attempts > 20:
+            unlockable.append(Capability.READ_SELF)
+        if Capability.READ_SELF in caps:
+            unlockable.append(Capability.MODIFY_PARAM)
+    return unlockable
+
+
+def test_unlock_table_matches_rules():
+    relevant = [Capability.EAT_TEXT, Capability.PATTERN_MATCH, Capability.REMEMBER,
+                Capability.ABSTRACT, Capability.CREATE, Capability.READ_SELF]
+    organism = Organism()
+    checked = set()
+    for mask in itertools.product((False, True), repeat=len(relevant)):
+        for low, high in ((0, 0.2), (1, 0.9)):
+            organism.capabilities = {c for c, on in zip(relevant, mask) if on}
+            organism.memory.clear()
+            organism.memory.extend([{}] * (60 if low else 10))
+            organism.age = 150 if low else 50
+            organism.social_interactions = 11 * low
+            organism.successful_predictions = 6 * low
+            organism.introspection_attempts = 21 * low
+            organism.traits.creativity = high
+            unlocks = organism.check_unlock_conditions()
+            assert unlocks == _reference_unlocks(organism)
+            checked.update(unlocks)
+    # Every rule fired at least once
+    assert checked == {Capability.REMEMBER, Capability.PATTERN_MATCH, Capability.SIGNAL,
+                       Capability.PREDICT, Capability.CREATE, Capability.READ_SELF,
+                       Capability.MODIFY_PARAM}
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Tests for the parent's bounded help queue.
+"""
+
+from types import SimpleNamespace
+
+from genesis.evolution import ParentHelp, HelpRequest
+
+
+def _child(energy=50, generation=0, name='c'):
+    return SimpleNamespace(id=name, energy=energy, generation=generation, capabilities=set())
+
+
+def _request(name, energy=50, request_type='stuck', generation=0):
+    return HelpRequest(_child(energy, generation, name), request_type, {})
+
+
+def test_queue_is_capped():
+    parent = ParentHelp()
+    parent.max_queued_requests = 5
+    for i in range(12):
+        parent.queue_request(_request(f'r{i}'))
+    assert len(parent.help_requests) == 5
+
+
+def test_eviction_drops_lowest_priority_then_newest():
+    parent = ParentHelp()
+    parent.max_queued_requests = 3
+
+    for name in ('a', 'b'):
+        parent.queue_request(_request(name))             # stuck: urgency 0.6
+    parent.queue_request(_request('urgent', energy=5))   # urgency 1.0
+    assert [r.organism_id for r in parent.help_requests] == ['urgent', 'a', 'b']
+
+    # Equal priority to a and b but newer: the newcomer is the one dropped
+    parent.queue_request(_request('c'))
+    assert [r.organism_id for r in parent.help_requests] == ['urgent', 'a', 'b']
+
+    # A higher-priority newcomer pushes out the newest of the lowest
+    parent.queue_request(_request('hungry', energy=20))  # urgency 0.8
+    assert [r.organism_id for r in parent.help_requests] == ['urgent', 'hungry', 'a']
+
+    # A low-urgency bug report ranks below everything queued
+    parent.queue_request(_request('bug', request_type='found_bug'))
+    assert [r.organism_id for r in parent.help_requests] == ['urgent', 'hungry', 'a']
+
+    # Among equal urgency and novelty, younger generations rank first
+    parent.queue_request(_request('old_urgent', energy=5, generation=3))
+    assert [r.organism_id for r in parent.help_requests] == ['urgent', 'old_urgent', 'hungry']
+
+
+def test_queue_order_matches_batch_priority():
+    parent = ParentHelp()
+    for i, energy in enumerate((50, 5, 20, 50, 5)):
+        parent.queue_request(_request(f'r{i}', energy=energy))
+    queued = [r.organism_id for r in parent.help_requests]
+    ranked = [r.organism_id for r in parent.economy.prioritize_help(parent.help_requests)]
+    assert queued == ranked == ['r1', 'r4', 'r2', 'r0', 'r3']
+
+
+def _quiet_parent(high_water, cap):
+    parent = ParentHelp()
+    parent.economy.verbose = False
+    parent.batch_high_water = high_water
+    parent.max_queued_requests = cap
+    return parent
+
+
+def test_batch_flushes_early_at_high_water():
+    parent = _quiet_parent(high_water=4, cap=20)
+    for i in range(3):
+        parent.queue_request(_request(f'r{i}'))
+    # Off-cadence day below the mark: requests wait for the regular pass
+    assert not parent.batch_ready()
+    assert parent.process_batch_if_due(7) is None
+    assert len(parent.help_requests) == 3
+
+    parent.queue_request(_request('r3'))
+    assert parent.batch_ready()
+    result = parent.process_batch_if_due(7)
+    assert result['helped'] + result['cached'] + result['refused'] == 4
+    assert parent.help_requests == []
+
+    # The regular cadence still drains a short queue
+    parent.queue_request(_request('r4'))
+    assert parent.process_batch_if_due(10) is not None
+    assert parent.help_requests == []
+
+
+def test_high_water_above_cap_still_flushes_when_full():
+    parent = _quiet_parent(high_water=32, cap=5)
+    for i in range(5):
+        parent.queue_request(_request(f'r{i}'))
+    # The queue can never reach 32, so a full queue counts as the mark
+    assert parent.batch_ready()
+    result = parent.process_batch_if_due(3)
+    assert result['helped'] + result['cached'] + result['refused'] == 5
+
+
+def test_high_water_below_cap_flushes_before_eviction():
+    parent = _quiet_parent(high_water=3, cap=5)
+    flushed = 0
+    for i in range(9):
+        parent.queue_request(_request(f'r{i}'))
+        result = parent.process_batch_if_due(1)
+        if result:
+            flushed += result['helped'] + result['cached'] + result['refused']
+        assert len(parent.help_requests) < 3
+    # Every request was served; none was evicted by the cap
+    assert flushed == 9
+
+
+def test_response_cache_evicts_least_recently_used():
+    economy = ParentHelp().economy
+    economy.cache_capacity = 2
+    a = _request('a', request_type='stuck')
+    b = _request('b', request_type='lonely')
+    c = _request('c', request_type='cannot_eat')
+    economy.cache_response(a, {'hint': 'a', 'organism_id': 'a', 'timestamp': 1.0})
+    economy.cache_response(b, {'hint': 'b'})
+
+    # Reading a makes b the least recently used entry
+    cached = economy.get_cached_response(_request('other', request_type='stuck'))
+    assert cached == {'hint': 'a', 'cached': True, 'organism_id': 'other'}
+
+    economy.cache_response(c, {'hint': 'c'})
+    assert len(economy.cached_responses) == 2
+    assert economy.can_use_cached_response(a)
+    assert not economy.can_use_cached_response(b)
+    assert economy.can_use_cached_response(c)